@@ -76,6 +76,15 @@ if not environ.get('PYSTACIA_SETUP'):
     netscape = lazy_imported('netscape')
     Image = lazy_imported('Image')
 
+    def warmup(formats=None, ops=None):
+        """Initialize ImageMagick up front.
+
+           See :func:`pystacia.api.warmup.warmup`.
+        """
+        from pystacia.api.warmup import warmup
+
+        return warmup(formats, ops)
+
     composites = really_lazy_enum('composites')
     types = really_lazy_enum('types')
     filters = really_lazy_enum('filters')
@@ -92,11 +101,12 @@ if not environ.get('PYSTACIA_SETUP'):
         'color', 'colors',
         'Image',
 
-        'registry']
+        'registry', 'warmup']
 
     from zope.deprecation import deprecated  # @UnresolvedImport
     from pystacia.compat import formattable
 
     msg = formattable('Use pystacia.image.{0} instead')
-    for symbol in set(__all__) - set(['color', 'colors', 'registry']):
+    for symbol in set(__all__) - set(['color', 'colors', 'registry',
+                                      'warmup']):
         deprecated(symbol, msg.format(symbol))
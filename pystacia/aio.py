@@ -0,0 +1,224 @@
+# coding: utf-8
+
+# pystacia/aio.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Awaitable API for :mod:`asyncio` applications.
+
+   Blocking calls are run on a dedicated pool of threads so the event loop
+   stays responsive. Number of calls submitted at once is bounded and
+   coroutines wait for free slots which gives natural backpressure.
+   Requires Python 3.7 or newer.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+
+
+class Executor(object):
+
+    """Pool of threads running blocking :term:`ImageMagick` calls.
+
+       :param threads: number of threads, number of CPUs by default
+       :type threads: ``int``
+       :param depth: maximum number of calls submitted at once, twice the
+         number of threads by default
+       :type depth: ``int``
+
+       Slots are occupied until a call actually finishes, also when the
+       coroutine awaiting it gets cancelled. Resources created by calls
+       which finish after cancellation are closed immediately.
+    """
+
+    def __init__(self, threads=None, depth=None):
+        threads = threads or cpu_count()
+
+        self.__executor = ThreadPoolExecutor(threads)
+        self.__depth = depth or threads * 2
+        # semaphores and number of their users keyed by id of event loop,
+        # kept only while the loop has calls in flight as semaphores
+        # reference their loop
+        self.__slots = {}
+
+    def __enter_slots(self, loop):
+        # semaphores are bound to event loop on older pythons
+        entry = self.__slots.get(id(loop))
+        if not entry:
+            entry = self.__slots[id(loop)] = [
+                asyncio.Semaphore(self.__depth), 0]
+
+        entry[1] += 1
+
+        return entry[0]
+
+    def __exit_slots(self, key):
+        entry = self.__slots[key]
+        entry[1] -= 1
+
+        if not entry[1]:
+            del self.__slots[key]
+
+    async def submit(self, function, *args, **kw):
+        """Run function in a thread and return its result."""
+        loop = asyncio.get_running_loop()
+        key = id(loop)
+        slots = self.__enter_slots(loop)
+
+        try:
+            await slots.acquire()
+        except:
+            self.__exit_slots(key)
+            raise
+
+        def release():
+            slots.release()
+            self.__exit_slots(key)
+
+        def done(future):
+            try:
+                loop.call_soon_threadsafe(release)
+            except RuntimeError:
+                # loop is closed and won't wait for slots anymore
+                self.__slots.pop(key, None)
+
+        try:
+            future = self.__executor.submit(function, *args, **kw)
+        except:
+            release()
+            raise
+
+        future.add_done_callback(done)
+
+        try:
+            return await asyncio.shield(asyncio.wrap_future(future))
+        except asyncio.CancelledError:
+            # calls that haven't started yet are simply dropped
+            if not future.cancel():
+                future.add_done_callback(partial(_close_result, args))
+            raise
+
+    def shutdown(self, wait=True):
+        """Stop threads after pending calls finish."""
+        self.__executor.shutdown(wait)
+
+
+def _close_result(args, future):
+    if future.cancelled() or future.exception() is not None:
+        return
+
+    result = future.result()
+    # resources passed in by caller are not ours to close
+    if isinstance(result, Resource) and not [x for x in args
+                                             if x is result]:
+        result.close()
+
+
+def get_executor():
+    """Return default :class:`Executor` creating it on first use.
+
+       Number of threads is taken from ``aio_threads`` registry key or
+       ``PYSTACIA_AIO_THREADS`` environment variable.
+    """
+    global __executor
+
+    if not __executor:
+        with __lock:
+            if not __executor:
+                threads = registry.get('aio_threads',
+                                       environ.get('PYSTACIA_AIO_THREADS'))
+                __executor = Executor(int(threads) if threads else None)
+
+    return __executor
+
+__executor = None
+__lock = Lock()
+
+
+async def read(filename, factory=None, hint_size=None, executor=None):
+    """Awaitable version of :func:`pystacia.image.read`."""
+    executor = executor or get_executor()
+
+    return await executor.submit(
+        image_module.read, filename, factory, hint_size)
+
+
+async def read_blob(blob, format=None, length=None,  # @ReservedAssignment
+                    factory=None, hint_size=None, executor=None):
+    """Awaitable version of :func:`pystacia.image.read_blob`."""
+    executor = executor or get_executor()
+
+    return await executor.submit(
+        image_module.read_blob, blob, format, length, factory, hint_size)
+
+
+async def get_blob(image, format, compression=None,  # @ReservedAssignment
+                   quality=None, factory=None, executor=None):
+    """Awaitable version of :meth:`pystacia.image.Image.get_blob`."""
+    executor = executor or get_executor()
+
+    return await executor.submit(
+        image.get_blob, format, compression, quality, factory)
+
+
+async def write(image, filename, format=None,  # @ReservedAssignment
+                compression=None, quality=None, flatten=None,
+                background=None, executor=None):
+    """Awaitable version of :meth:`pystacia.image.Image.write`."""
+    executor = executor or get_executor()
+
+    await executor.submit(image.write, filename, format, compression,
+                          quality, flatten, background)
+
+
+async def run(input, ops, factory=None,  # @ReservedAssignment
+              executor=None):
+    """Load input and apply chain of operations in a single call.
+
+       :param input: file name, blob, buffer or image
+       :param ops: operations as callables accepting an image or tuples of
+         method name and its arguments
+       :type ops: iterable
+       :param factory: Image subclass to use when instantiating objects
+       :rtype: :class:`pystacia.image.Image`
+
+       Inputs are loaded with :func:`pystacia.batch.load`. Image passed as
+       input is modified in place. Images loaded here are closed when
+       an operation fails or the call gets cancelled.
+
+       >>> img = await run(blob, [('rescale', 128, 128), ('sepia',)])
+       >>> blob = await get_blob(img, 'jpeg')
+    """
+    executor = executor or get_executor()
+
+    return await executor.submit(_run, input, list(ops), factory)
+
+
+def _run(input, ops, factory):  # @ReservedAssignment
+    img = load(input, factory)
+
+    try:
+        for op in ops:
+            if callable(op):
+                op(img)
+            else:
+                getattr(img, op[0])(*op[1:])
+    except:
+        if img is not input:
+            img.close()
+        raise
+
+    return img
+
+
+from os import environ
+from multiprocessing import cpu_count
+
+from pystacia import registry
+from pystacia import image as image_module
+from pystacia.common import Resource
+from pystacia.batch import load
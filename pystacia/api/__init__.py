@@ -165,20 +165,96 @@ class library_path_transaction:
         chdir(self.old_path)
 
 
+def load_library(path):
+    if not path:
+        msg = 'Could not find or load MagickWand'
+        raise PystaciaException(msg)
+
+    msg = formattable('Loading MagickWand from {0}')
+    logger.debug(msg.format(path))
+
+    return CDLL(path)
+
+
+def load_cached(environ):
+    """Load DLL found by previous process if it's still in place.
+
+       Falls back to :func:`find_library` and records its result in
+       :mod:`pystacia.api.cache` when search settings changed, DLL has been
+       modified or can not be loaded anymore.
+    """
+    osname = get_osname()
+    skip_system = registry.get('skip_system',
+                               environ.get('PYSTACIA_SKIP_SYSTEM'))
+    search = cache.fingerprint(gather_paths(environ), bool(skip_system),
+                               name, abis, osname)
+
+    record = cache.load(search, environ)
+    if record:
+        path = record['dll']
+        msg = formattable('Using cached location of MagickWand {0}')
+        logger.debug(msg.format(path))
+
+        depends_path = join(dirname(path), 'depends.txt')
+        if exists(depends_path):
+            process_depends(depends_path, dirname(path), osname, CDLL)
+
+        try:
+            if osname == 'windows':
+                # dependencies are looked up in working directory
+                transaction = library_path_transaction(dirname(path)).begin()
+                try:
+                    return load_library(path)
+                finally:
+                    transaction.commit()
+
+            return load_library(path)
+        except:
+            from sys import exc_info
+            msg = formattable('Could not load cached {0}: {1}')
+            logger.debug(msg.format(path, exc_info()[1]))
+
+    path = find_library(name, abis, environ=environ)
+    dll = load_library(path)
+
+    # names resolved by the system loader are stored as actual files
+    path = get_library_path(dll, 'MagickWandGenesis') or path
+    if cache.is_enabled(environ) and cache.get_stat(path):
+        cache.start(search, path)
+
+    return dll
+
+
 __lock = Lock()
 
 
-def init_dll(dll):
-    def shutdown():
-        logger.debug('Cleaning up traced instances')
-        _cleanup()
+def shutdown():
+    """Free tracked resources and terminate MagickWand.
+
+       Registered as atexit handler once the library gets initialized.
+       Processes exiting without running atexit handlers e.g.
+       :mod:`multiprocessing` workers should call it explicitly. Subsequent
+       calls do nothing.
+    """
+    with __lock:
+        if shutdown.__done:
+            return
 
-        c_call(None, 'terminus')
+        shutdown.__done = True
 
-        if jython:
-            from java.lang import System  # @UnresolvedImport
-            System.exit(0)
+    logger.debug('Cleaning up traced instances')
+    _cleanup()
 
+    c_call(None, 'terminus')
+
+    if jython:
+        from java.lang import System  # @UnresolvedImport
+        System.exit(0)
+
+shutdown.__done = False
+
+
+def init_dll(dll):
     logger.debug('Critical section - init MagickWand')
     with __lock:
         if not dll.__inited:
@@ -210,14 +286,12 @@ def get_dll(init=True, environ=None, isolated=False):
                 if not environ:
                     environ = os.environ
 
-                path = find_library(name, abis, environ=environ)
-                if not path:
-                    msg = 'Could not find or load MagickWand'
-                    raise PystaciaException(msg)
+                if isolated:
+                    path = find_library(name, abis, environ=environ)
+                    dll = load_library(path)
+                else:
+                    dll = load_cached(environ)
 
-                msg = formattable('Loading MagickWand from {0}')
-                logger.debug(msg.format(path))
-                dll = CDLL(path)
                 if not isolated:
                     get_dll.__dll = dll
                     get_dll.__dll.__inited = False
@@ -238,7 +312,9 @@ from pystacia.compat import formattable, jython
 from pystacia.common import _cleanup
 from pystacia import magick
 from pystacia.api.func import c_call
-from pystacia.api.compat import CDLL, find_library as ctypes_find_library
+from pystacia.api import cache
+from pystacia.api.compat import (
+    CDLL, find_library as ctypes_find_library, get_library_path)
 
 
 min_version = (6, 5, 9, 0)
@@ -0,0 +1,204 @@
+# coding: utf-8
+
+# pystacia/api/buffer.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Utilities for passing buffer protocol objects to C functions."""
+
+from pystacia.common import Resource
+
+
+def get_size(obj):
+    """Return size in bytes of buffer protocol object."""
+    if memoryview is None:
+        # python 2.5 and 2.6 can only pass strings
+        if isinstance(obj, binary_type):
+            return len(obj)
+
+        raise TypeError('memoryview is not available')
+
+    view = memoryview(obj)
+
+    try:
+        return view.nbytes
+    except AttributeError:
+        # python 2.x memoryview has no nbytes
+        return len(view) * view.itemsize
+
+
+def is_buffer(obj):
+    """Return ``True`` if object supports buffer protocol.
+
+       Always ``False`` on Python versions without :func:`memoryview`.
+    """
+    if memoryview is None:
+        return False
+
+    try:
+        memoryview(obj)
+    except TypeError:
+        return False
+
+    return True
+
+
+class exported(object):
+
+    """Context guard exposing memory of a buffer protocol object.
+
+       Yields a tuple of pointer and size in bytes. The pointer can be
+       passed directly as ``void *`` argument of C functions and is only
+       valid within the guarded block. Memory is shared with the object,
+       no copies are made. Read-only objects like ``bytes`` or read-only
+       ``mmap`` are accepted unless writable is set. On Python
+       implementations without C-API access those are copied.
+
+       >>> data = bytearray(16)
+       >>> with exported(data, writable=True) as (pointer, size):
+       ...     c_call(image, ('export', 'pixels'), ..., pointer)
+    """
+
+    def __init__(self, obj, writable=False):
+        self.__obj = obj
+        self.__writable = writable
+        self.__pointer = None
+        self.__view = None
+
+    def __enter__(self):
+        obj = self.__obj
+
+        try:
+            size = get_size(obj)
+        except TypeError:
+            template = formattable('{0} does not support buffer protocol')
+            raise PystaciaException(template.format(type(obj).__name__))
+
+        try:
+            self.__pointer = (c_char * size).from_buffer(obj)
+        except (TypeError, ValueError):
+            # numpy reports non-contiguous arrays with ValueError
+            if self.__writable:
+                template = formattable(
+                    '{0} is not a writable contiguous buffer')
+                raise PystaciaException(template.format(type(obj).__name__))
+
+            self.__pointer = self.__export_readonly(obj, size)
+
+        return self.__pointer, size
+
+    def __export_readonly(self, obj, size):
+        if isinstance(obj, binary_type):
+            # ctypes passes address of bytes data as is
+            return obj
+
+        if get_buffer:
+            view = Py_buffer()
+            try:
+                get_buffer(obj, byref(view), PyBUF_SIMPLE)
+            except (BufferError, ValueError):
+                template = formattable('{0} is not a contiguous buffer')
+                raise PystaciaException(template.format(type(obj).__name__))
+
+            self.__view = view
+
+            return c_void_p(view.buf)
+
+        return (c_char * size).from_buffer_copy(obj)
+
+    def __exit__(self, type, value, traceback):  # @ReservedAssignment
+        # drop the reference so the buffer export gets released
+        self.__pointer = None
+
+        if self.__view is not None:
+            release_buffer(byref(self.__view))
+            self.__view = None
+
+
+class Blob(Resource):
+
+    """Block of memory allocated by :term:`ImageMagick`.
+
+       Owns memory returned by C functions such as MagickGetImageBlob and
+       frees it with MagickRelinquishMemory when closed or collected. Use
+       :meth:`get_buffer` to access the data without copying.
+    """
+
+    def __init__(self, resource=None, size=0):
+        self.__size = size
+
+        super(Blob, self).__init__(resource)
+
+    def _alloc(self):
+        raise PystaciaException('Blob cannot be allocated directly')
+
+    def _free(self):
+        c_call('magick_', 'relinquish_memory', self.resource)
+
+    def _clone(self):
+        return None
+
+    def __len__(self):
+        return self.__size
+
+    def get_buffer(self):
+        """Return buffer protocol object sharing memory with this blob.
+
+           :rtype: ``ctypes`` array of ``c_char``
+
+           Returned object can be passed wherever bytes-like objects are
+           accepted e.g. to :func:`memoryview`, ``file.write`` or
+           ``socket.send``. It keeps reference to this blob so the memory
+           stays valid until the buffer and all its views are released.
+        """
+        buffer = (c_char * self.__size).from_address(  # @ReservedAssignment
+            self.resource)
+        buffer._blob = self
+
+        return buffer
+
+
+from ctypes import c_char, c_int, c_void_p, c_char_p, byref, Structure
+
+from pystacia.util import PystaciaException
+from pystacia.compat import formattable, pypy, jython
+from pystacia.api.compat import c_ssize_t
+from pystacia.api.func import c_call
+
+from six import binary_type
+
+try:
+    memoryview = memoryview  # @ReservedAssignment
+except NameError:
+    memoryview = None  # @ReservedAssignment
+
+
+class Py_buffer(Structure):
+    _fields_ = [
+        ('buf', c_void_p),
+        ('obj', c_void_p),
+        ('len', c_ssize_t),
+        ('itemsize', c_ssize_t),
+        ('readonly', c_int),
+        ('ndim', c_int),
+        ('format', c_char_p),
+        ('shape', c_void_p),
+        ('strides', c_void_p),
+        ('suboffsets', c_void_p),
+        # python 2.x keeps smalltable here, leave room for it
+        ('reserved', c_void_p * 4)]
+
+
+PyBUF_SIMPLE = 0
+
+get_buffer = release_buffer = None
+
+if not pypy and not jython:
+    from ctypes import pythonapi, PYFUNCTYPE, POINTER, py_object
+
+    get_buffer = PYFUNCTYPE(c_int, py_object, POINTER(Py_buffer), c_int)(
+        ('PyObject_GetBuffer', pythonapi))
+    release_buffer = PYFUNCTYPE(None, POINTER(Py_buffer))(
+        ('PyBuffer_Release', pythonapi))
@@ -0,0 +1,206 @@
+# coding: utf-8
+
+# pystacia/api/cache.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Persistent cache of MagickWand discovery and configuration.
+
+   Searching for the DLL, querying configure options and the list of
+   formats takes a noticeable part of process startup. Their results are
+   stored in a JSON file keyed by search settings and validated against
+   path, modification time and size of the DLL so subsequent processes
+   skip the discovery.
+
+   Location of the cache is taken from ``cache_dir`` registry key or
+   ``PYSTACIA_CACHE_DIR`` environment variable and defaults to per-user
+   cache directory of the platform. Setting ``no_cache`` registry key or
+   ``PYSTACIA_NO_CACHE`` environment variable disables it.
+"""
+
+from __future__ import with_statement
+
+from threading import Lock
+
+
+def is_enabled(environ=None):
+    """Check if the cache should be used."""
+    if not environ:
+        environ = os.environ
+
+    return not registry.get('no_cache', environ.get('PYSTACIA_NO_CACHE'))
+
+
+def get_directory(environ=None):
+    """Return directory where cache files are stored."""
+    if not environ:
+        environ = os.environ
+
+    path = registry.get('cache_dir', environ.get('PYSTACIA_CACHE_DIR'))
+    if path:
+        return path
+
+    osname = get_osname()
+    if osname == 'windows':
+        base = environ.get('LOCALAPPDATA') or environ.get('APPDATA')
+    elif osname == 'macos':
+        base = join(expanduser('~'), 'Library', 'Caches')
+    else:
+        base = (environ.get('XDG_CACHE_HOME') or
+                join(expanduser('~'), '.cache'))
+
+    return join(base or gettempdir(), 'pystacia')
+
+
+def fingerprint(*parts):
+    """Return stable hash of JSON serializable parts."""
+    data = dumps(parts, sort_keys=True)
+    return sha1(data.encode('utf-8')).hexdigest()
+
+
+def get_stat(path):
+    """Return modification time and size of file or ``None``."""
+    try:
+        info = stat(path)
+    except OSError:
+        return None
+
+    return [info.st_mtime, info.st_size]
+
+
+def load(search, environ=None):
+    """Load record stored for given search settings.
+
+       :param search: fingerprint of settings DLL has been searched with
+       :type search: ``str``
+       :rtype: ``dict`` or ``None``
+
+       Returns ``None`` if there's no valid record e.g. DLL has been
+       replaced in the meantime. Valid record becomes current one.
+    """
+    global __record, __path
+
+    if not is_enabled(environ):
+        return None
+
+    path = join(get_directory(environ), 'discovery-' + search[:16] + '.json')
+
+    with __lock:
+        __path = path
+        __record = None
+
+        try:
+            f = open(path)
+            try:
+                record = loads(f.read())
+            finally:
+                f.close()
+        except (IOError, OSError, ValueError):
+            return None
+
+        if (not isinstance(record, dict) or
+                record.get('format') != __format or
+                record.get('search') != search or
+                get_stat(record.get('dll') or '') != record.get('stat')):
+            logger.debug('Discarding stale discovery cache ' + path)
+            return None
+
+        __record = record
+
+    return record
+
+
+def start(search, dll):
+    """Start new current record for DLL found with search settings."""
+    global __record
+
+    with __lock:
+        __record = {'format': __format, 'search': search, 'dll': dll,
+                    'stat': get_stat(dll)}
+
+    _save()
+
+
+def get(key):
+    """Return value stored in current record or ``None``."""
+    record = __record
+
+    if not record:
+        return None
+
+    return record.get(key)
+
+
+def update(**values):
+    """Store values in current record and write it to disk."""
+    with __lock:
+        if not __record:
+            return
+
+        __record.update(values)
+
+    _save()
+
+
+def _save():
+    with __lock:
+        if not __record or not __path:
+            return
+
+        path = __path
+        data = dumps(__record, sort_keys=True)
+
+        try:
+            write(path, data)
+        except (IOError, OSError):
+            template = formattable('Could not write discovery cache {0}: {1}')
+            logger.debug(template.format(path, exc_info()[1]))
+
+
+def write(path, data):
+    """Write data to file creating its directory if needed.
+
+       Data are written aside and renamed over path so readers never see
+       partial files.
+    """
+    directory = dirname(path)
+    if not exists(directory):
+        makedirs(directory)
+
+    fd, tmp_path = mkstemp(dir=directory, suffix='.tmp')
+    f = fdopen(fd, 'w')
+    try:
+        f.write(data)
+    finally:
+        f.close()
+
+    replace(tmp_path, path)
+
+__record = None
+__path = None
+__lock = Lock()
+__format = 1
+
+
+from sys import exc_info
+import os
+from os import stat, makedirs, fdopen
+from os.path import join, dirname, exists, expanduser
+from tempfile import gettempdir, mkstemp
+from hashlib import sha1
+from json import dumps, loads
+from logging import getLogger
+
+from pystacia import registry
+from pystacia.util import get_osname
+from pystacia.compat import formattable
+
+try:
+    from os import replace
+except ImportError:
+    from os import rename as replace  # NOQA
+
+
+logger = getLogger('pystacia.api.cache')
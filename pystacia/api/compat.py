@@ -7,8 +7,9 @@
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 
 from ctypes import (c_char_p, c_size_t, c_double, c_uint,  # NOQA
-                    c_int, byref)
-from pystacia.compat import jython
+                    c_int, byref, sizeof, c_ubyte, c_ushort, c_float,
+                    c_ulonglong)
+from pystacia.compat import jython, native_str
 
 
 if jython:
@@ -34,3 +35,50 @@ else:
             c_ssize_t = c_long
         elif sizeof(c_ulonglong) == sizeof(c_void_p):
             c_ssize_t = c_longlong
+
+
+def get_library_path(dll, symbol):
+    """Return path shared library has been loaded from or ``None``.
+
+       Libraries found by system loader are known by their bare names
+       only. Path is looked up by address of given exported symbol.
+    """
+    if jython:
+        return None
+
+    try:
+        from ctypes import windll
+    except ImportError:
+        pass
+    else:
+        from ctypes import create_unicode_buffer
+
+        path = create_unicode_buffer(1024)
+        if windll.kernel32.GetModuleFileNameW(c_void_p(dll._handle), path,
+                                              1024):
+            return path.value
+
+        return None
+
+    from ctypes import Structure, cast
+    from ctypes.util import find_library as find
+
+    class DlInfo(Structure):
+        _fields_ = [('dli_fname', c_char_p), ('dli_fbase', c_void_p),
+                    ('dli_sname', c_char_p), ('dli_saddr', c_void_p)]
+
+    # dladdr lives in libdl on glibc older than 2.34
+    for library in None, find('dl'):
+        try:
+            dladdr = CDLL(library).dladdr
+        except (OSError, AttributeError):
+            continue
+
+        info = DlInfo()
+        address = cast(getattr(dll, symbol), c_void_p)
+        if not dladdr(address, byref(info)) or not info.dli_fname:
+            return None
+
+        return native_str(info.dli_fname)
+
+    return None
@@ -0,0 +1,197 @@
+# coding: utf-8
+
+# pystacia/api/ffi.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Calling MagickWand through :term:`cffi` in ABI mode.
+
+   Declarations are generated from :mod:`pystacia.api.metadata`. Wand
+   pointers are declared as ``uintptr_t`` so they travel as plain integers
+   taken from and wrapped back into the ctypes pointer types used by the
+   rest of pystacia, which is ABI compatible on all supported platforms.
+   Symbols taking or returning other pointers e.g. output parameters are
+   not declared and stay with ctypes.
+"""
+
+from pystacia.util import memoized
+
+
+def is_available():
+    """Check if :term:`cffi` can be imported."""
+    return FFI is not None
+
+
+def get_type_name(type):  # @ReservedAssignment
+    """Return C name of ctypes type or ``None`` if it's not supported."""
+    if type is None:
+        return 'void'
+
+    return __types.get(type)
+
+
+def declare(method_name, argtypes, restype):
+    """Return C declaration of function or ``None`` if not supported."""
+    names = [get_type_name(t) for t in argtypes]
+    result = get_type_name(restype)
+
+    if None in names or not result:
+        return None
+
+    template = formattable('{0} {1}({2});')
+    return template.format(result, method_name, ', '.join(names) or 'void')
+
+
+@memoized
+def get_library():
+    """Return FFI instance and MagickWand opened through it."""
+    ffi = FFI()
+
+    declarations = {}
+    for api_type, type_data in metadata.items():
+        for method in type_data['symbols']:
+            method_name, argtypes, restype = get_signature(api_type, method)
+            declaration = declare(method_name, argtypes, restype)
+            if declaration:
+                declarations[method_name] = declaration
+
+    ffi.cdef('\n'.join(declarations.values()))
+
+    return ffi, ffi.dlopen(get_dll(False)._name)
+
+
+def make_stub(api_type, method):
+    """Return stub calling symbol through cffi.
+
+       Accepts and returns the same values as stubs made by
+       :func:`pystacia.api.func.make_stub`. Returns ``None`` if signature of
+       the symbol can not be declared.
+    """
+    method_name, argtypes, restype = get_signature(api_type, method)
+    if not declare(method_name, argtypes, restype):
+        return None
+
+    ffi, lib = get_library()
+    function = getattr(lib, method_name)
+
+    msg = formattable('Compiling cffi stub for {0}')
+    logger.debug(msg.format(method_name))
+
+    converters = tuple(_make_converter(t) for t in argtypes)
+    handler = _make_result_handler(ffi, restype, argtypes)
+
+    def stub(*args):
+        # keep references to casted objects until the call returns
+        keep_ = []
+        args_ = [convert(arg, keep_) if convert else arg
+                 for convert, arg in zip(converters, args)]
+
+        result = function(*args_)
+
+        del keep_
+
+        if handler is None:
+            return result
+
+        return handler(result, args)
+
+    stub.__name__ = method_name
+    stub.c_method = function
+
+    return stub
+
+
+def _pointer(arg):
+    if isinstance(arg, Resource):
+        arg = arg.resource
+
+    if arg is None:
+        return 0
+
+    return getattr(arg, 'value', arg) or 0
+
+
+def _make_converter(argtype):
+    if argtype == c_char_p:
+        def convert(arg, keep_):
+            if isinstance(arg, text_type):
+                arg = bytes_(arg)
+
+            return arg
+    elif argtype in (c_size_t, c_ssize_t, c_uint):
+        def convert(arg, keep_):
+            return int(arg)
+    elif argtype == PixelWand_p:
+        def convert(arg, keep_):
+            if not isinstance(arg, PixelWand_p):
+                arg = color_cast(arg)
+                keep_.append(arg)
+
+            return _pointer(arg)
+    elif argtype == MagickWand_p:
+        def convert(arg, keep_):
+            return _pointer(arg)
+    else:
+        return None
+
+    return convert
+
+
+def _make_result_handler(ffi, restype, argtypes):
+    if restype == c_char_p:
+        def handle(result, args):
+            if result == ffi.NULL:
+                return None
+
+            return native_str(ffi.string(result))
+
+        return handle
+    elif restype in (MagickWand_p, PixelWand_p):
+        return lambda result, args: restype(result)
+    elif restype == MagickBoolean:
+        def handle(result, args):
+            if not result:
+                handle_result(result, restype, args, argtypes)
+
+            return result
+
+        return handle
+
+    return None
+
+
+from pystacia.compat import native_str, formattable
+from pystacia.common import Resource
+from pystacia.color import _cast_input as color_cast
+from pystacia.api import get_dll, logger
+from pystacia.api.metadata import data as metadata
+from pystacia.api.func import get_signature, handle_result
+from pystacia.api.type import (
+    MagickWand_p, PixelWand_p, MagickBoolean, ExceptionType, enum)
+from pystacia.api.compat import (
+    c_char_p, c_size_t, c_ssize_t, c_uint, c_int, c_double, c_ulonglong)
+
+from six import b as bytes_, text_type
+
+try:
+    from cffi import FFI
+except ImportError:
+    FFI = None
+
+__types = {
+    c_int: 'int',
+    c_uint: 'unsigned int',
+    c_double: 'double',
+    c_char_p: 'char *',
+    c_ulonglong: 'unsigned long long',
+    # size types may alias int types of the same width
+    c_size_t: 'size_t',
+    c_ssize_t: 'ssize_t',
+    enum: 'int',
+    MagickBoolean: 'int',
+    ExceptionType: 'int',
+    MagickWand_p: 'uintptr_t',
+    PixelWand_p: 'uintptr_t'
+}
@@ -6,7 +6,11 @@
 # This module is part of Pystacia and is released under
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 
-from threading import Lock
+from __future__ import with_statement
+
+from os import environ
+from threading import Lock, RLock
+from functools import partial
 
 from six import b as bytes_, text_type
 
@@ -15,29 +19,36 @@ from pystacia.compat import pypy
 from pystacia.api.metadata import data as metadata
 
 
-@memoized
-def get_c_method(api_type, method, throw=True):
+def get_signature(api_type, method):
+    """Return C name, argument types and result type of symbol."""
     type_data = metadata[api_type]
     method_name = type_data['format'](method)
-
-    if not throw and not hasattr(get_dll(False), method_name):
-        return False
-
-    c_method = getattr(get_dll(False), method_name)
-
-    msg = formattable('Annoting {0}')
-    logger.debug(msg.format(method_name))
     method_data = type_data['symbols'][method]
 
     argtypes = method_data[0]
     if 'arg' in type_data:
         argtypes = (type_data['arg'],) + argtypes
-    c_method.argtypes = argtypes
 
     restype = type_data.get('result', None)
     if len(method_data) == 2:
         restype = method_data[1]
-    c_method.restype = restype
+
+    return method_name, argtypes, restype
+
+
+@memoized
+def get_c_method(api_type, method, throw=True):
+    method_name = metadata[api_type]['format'](method)
+
+    if not throw and not hasattr(get_dll(False), method_name):
+        return False
+
+    c_method = getattr(get_dll(False), method_name)
+
+    msg = formattable('Annoting {0}')
+    logger.debug(msg.format(method_name))
+
+    _, c_method.argtypes, c_method.restype = get_signature(api_type, method)
 
     return method_name, c_method
 
@@ -97,7 +108,165 @@ def prepare_args(c_method, obj, args):
     return keep_, args_, should_lock
 
 
-def c_call(obj, method, *args, **kw):
+def _make_converter(argtype):
+    """Return function coercing single argument of given C type.
+
+       Returns ``None`` when arguments of this type are passed as is.
+    """
+    if argtype == c_char_p:
+        def convert(arg, keep_):
+            if isinstance(arg, text_type):
+                arg = bytes_(arg)
+
+            return arg
+    elif argtype in (c_size_t, c_ssize_t, c_uint):
+        def convert(arg, keep_):
+            return int(arg)
+    elif argtype == PixelWand_p:
+        def convert(arg, keep_):
+            if not isinstance(arg, PixelWand_p):
+                arg = color_cast(arg)
+                keep_.append(arg)
+
+            if isinstance(arg, Resource):
+                arg = arg.resource
+
+            return arg
+    elif argtype == c_double:
+        return None
+    else:
+        def convert(arg, keep_):
+            if isinstance(arg, Resource):
+                arg = arg.resource
+
+            return arg
+
+    return convert
+
+
+def _make_result_handler(restype, argtypes):
+    """Return function post-processing result of given C type.
+
+       Returns ``None`` when result is passed back as is.
+    """
+    if restype == c_char_p:
+        return native_str
+    elif restype in (c_uint, c_ssize_t, c_size_t):
+        return int
+    elif restype == enum and not jython:
+        return lambda result: result.value
+    elif restype == MagickBoolean:
+        # defer to generic handler to raise exception on failure
+        def handle(result, args_):
+            if not result:
+                handle_result(result, restype, args_, argtypes)
+
+            return result
+
+        return handle
+
+    return None
+
+
+def make_stub(api_type, method):
+    """Build callable specialized for a single C function.
+
+       Argument coercion and result handling are resolved once for given
+       symbol from its metadata so calling the stub only performs what is
+       necessary for this particular function. Stub accepts the same
+       arguments as the C function with :class:`pystacia.common.Resource`
+       instances in place of raw pointers.
+    """
+    method_name, c_method = get_c_method(api_type, method)
+
+    if get_backend() == 'cffi':
+        stub = ffi.make_stub(api_type, method)
+        if stub:
+            return stub
+
+    msg = formattable('Compiling stub for {0}')
+    logger.debug(msg.format(method_name))
+
+    argtypes = c_method.argtypes or ()
+    converters = tuple(_make_converter(t) for t in argtypes)
+    handler = _make_result_handler(c_method.restype, argtypes)
+    should_lock = pypy and c_char_p in argtypes
+    needs_args = c_method.restype == MagickBoolean
+
+    def stub(*args):
+        # keep references to casted objects until the call returns
+        # so GC does not free resources passed to ImageMagick
+        keep_ = []
+        args_ = [convert(arg, keep_) if convert else arg
+                 for convert, arg in zip(converters, args)]
+
+        if should_lock:
+            __lock.acquire()
+            try:
+                result = c_method(*args_)
+            finally:
+                __lock.release()
+        else:
+            result = c_method(*args_)
+
+        del keep_
+
+        if handler is None:
+            return result
+        elif needs_args:
+            return handler(result, args_)
+        else:
+            return handler(result)
+
+    stub.__name__ = method_name
+    stub.c_method = c_method
+
+    return stub
+
+
+__stubs = {}
+__stubs_lock = RLock()
+
+
+def get_stub(api_type, method, init=True):
+    """Return cached stub for given symbol creating it on first use."""
+    key = api_type, method
+
+    try:
+        return __stubs[key]
+    except KeyError:
+        pass
+
+    if init:
+        get_dll()
+
+    with __stubs_lock:
+        if key not in __stubs:
+            __stubs[key] = make_stub(api_type, method)
+
+    return __stubs[key]
+
+
+def bind(obj, method):
+    """Return stub for method of given api type or :class:`Resource` class.
+
+       Useful in tight loops to skip translation performed by
+       :func:`c_call` on each call. Resource arguments are not prepended
+       automatically.
+    """
+    if hasattr(obj, '_api_type'):
+        obj = obj._api_type
+
+    return get_stub(obj, method)
+
+
+def c_call_generic(obj, method, *args, **kw):
+    """Call C function translating arguments on each call.
+
+       This is the slow path used when stubs are disabled with
+       ``no_stubs`` registry key or ``PYSTACIA_NO_STUBS`` environment
+       variable. It logs every translated call.
+    """
     if hasattr(obj.__class__, '_api_type'):
         api_type = obj.__class__._api_type
     else:
@@ -141,12 +310,89 @@ def c_call(obj, method, *args, **kw):
         result, c_method.restype, args_, c_method.argtypes)
 
 
+def use_stubs():
+    """Check whether :func:`c_call` dispatches through precompiled stubs."""
+    global __use_stubs
+
+    if __use_stubs is None:
+        disabled = registry.get('no_stubs', environ.get('PYSTACIA_NO_STUBS'))
+        __use_stubs = not disabled
+
+    return __use_stubs
+
+__use_stubs = None
+
+
+def get_backend():
+    """Return name of library calling C functions from stubs.
+
+       Either ``'ctypes'`` (default) or ``'cffi'`` as chosen with
+       ``backend`` registry key or ``PYSTACIA_BACKEND`` environment
+       variable. Falls back to ``'ctypes'`` if :term:`cffi` is not
+       available. Symbols with signatures :mod:`pystacia.api.ffi` can not
+       express are always called with ctypes.
+    """
+    global __backend
+
+    if __backend is None:
+        backend = registry.get('backend', environ.get('PYSTACIA_BACKEND'))
+        backend = backend or 'ctypes'
+
+        if backend not in ('ctypes', 'cffi'):
+            template = formattable('Unknown backend {0}')
+            raise PystaciaException(template.format(backend))
+
+        if backend == 'cffi' and not ffi.is_available():
+            logger.warning('cffi is not available, falling back to ctypes')
+            backend = 'ctypes'
+
+        __backend = backend
+
+    return __backend
+
+__backend = None
+
+
+# hooks installed by pystacia.api.trace, empty tuple keeps tracing off
+_hooks = ()
+
+
+def c_call(obj, method, *args, **kw):
+    if not use_stubs():
+        if _hooks:
+            return trace.dispatch(_hooks, obj, method,
+                                  partial(c_call_generic, obj, method, **kw),
+                                  args)
+
+        return c_call_generic(obj, method, *args, **kw)
+
+    if hasattr(obj.__class__, '_api_type'):
+        api_type = obj.__class__._api_type
+    else:
+        api_type = obj
+
+    try:
+        init = kw.pop('__init')
+    except KeyError:
+        init = True
+
+    if isinstance(obj, Resource):
+        args = (obj,) + args
+
+    if _hooks:
+        return trace.dispatch(_hooks, obj, method,
+                              get_stub(api_type, method, init), args)
+
+    return get_stub(api_type, method, init)(*args)
+
+
+from pystacia import registry
 from pystacia.util import PystaciaException
 from pystacia.compat import native_str, formattable, jython
-from pystacia.api import get_dll, logger
+from pystacia.api import get_dll, logger, ffi, trace
 from pystacia.api.type import (
     MagickWand_p, PixelWand_p, MagickBoolean, ExceptionType, enum)
 from pystacia.api.compat import (
-    c_char_p, c_size_t, c_uint, string_at, c_ssize_t, byref)
+    c_char_p, c_size_t, c_uint, string_at, c_ssize_t, byref, c_double)
 from pystacia.common import Resource
-from pystacia.color import cast as color_cast
+from pystacia.color import _cast_input as color_cast
@@ -1,4 +1,5 @@
-from ctypes import c_char_p, c_void_p, POINTER, c_size_t, c_double, c_uint
+from ctypes import (c_char_p, c_void_p, POINTER, c_size_t, c_double, c_uint,
+                    c_ulonglong)
 
 from six import string_types
 
@@ -19,6 +20,7 @@ s = c_size_t
 ss = c_ssize_t
 d = c_double
 u = c_uint
+ull = c_ulonglong
 
 
 def magick_format(name):
@@ -68,6 +70,8 @@ data = {
             'get_format': ((), ch),
             'set_format': ((ch,), b),
             'set_depth': ((s,), b),
+            'set_option': ((ch, ch), b),
+            'get_number_images': ((), s),
             'get_exception': ((P(ExceptionType),), v)
         }
     },
@@ -79,6 +83,10 @@ data = {
             'query_configure_option': ((ch,), ch),
             'query_formats': ((ch, P(s)), P(ch)),
             'get_version': ((P(s),), ch),
+            'get_resource': ((e,), ull),
+            'get_resource_limit': ((e,), ull),
+            # MagickBooleanType, failures are not kept in any exception
+            'set_resource_limit': ((e, ull), u),
             'relinquish_memory': ((v,), v)
         }
     },
@@ -107,11 +115,14 @@ data = {
         'format': image_format,
         'arg': w,
         'symbols': {
+            'new': ((s, s, pw), b),
             'read': ((ch,), b),
             'write': ((ch,), b),
             'ping': ((ch,), b),
-            ('ping', 'blob'): ((ch, s), b),
-            ('read', 'blob'): ((ch, s), b),
+            ('ping', 'blob'): ((v, s), b),
+            ('read', 'blob'): ((v, s), b),
+            ('read', 'file'): ((v,), b),
+            ('write', 'file'): ((v,), b),
             ('get', 'blob'): ((P(s),), v),
 
             ('set', 'format'): ((ch,), b),
@@ -128,11 +139,16 @@ data = {
             ('set', 'colorspace'): ((e,), b),
             ('get', 'pixel_color'): ((ss, ss, pw),
                                      b),
+            ('export', 'pixels'): ((ss, ss, s, s, ch, e, v), b),
+            ('import', 'pixels'): ((ss, ss, s, s, ch, e, v), b),
             ('set', 'background_color'): ((pw,), b),
             ('get', 'background_color'): ((pw,), b),
             ('transform', 'colorspace'): ((e,), b),
 
             'resize': ((s, s, e, d), b),
+            'thumbnail': ((s, s), b),
+            'scale': ((s, s), b),
+            'strip': ((), b),
             'crop': ((s, s, ss, ss), b),
             'rotate': ((pw, d), b),
             'flip': ((), b),
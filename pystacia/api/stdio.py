@@ -0,0 +1,116 @@
+# coding: utf-8
+
+# pystacia/api/stdio.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Utilities for passing Python file objects to C functions as FILE*."""
+
+from pystacia.util import memoized
+
+
+@memoized
+def get_libc():
+    """Return C library with stdio functions prototyped."""
+    if jython or get_osname() == 'windows':
+        # FILE* streams can't be shared with a library linked against
+        # different C runtime
+        raise PystaciaException('FILE* streams are not supported '
+                                'on this platform')
+
+    libc = CDLL(find_library('c'))
+
+    libc.fdopen.argtypes = (c_int, c_char_p)
+    libc.fdopen.restype = c_void_p
+    libc.fflush.argtypes = (c_void_p,)
+    libc.fflush.restype = c_int
+    libc.ftell.argtypes = (c_void_p,)
+    libc.ftell.restype = c_long
+    libc.fclose.argtypes = (c_void_p,)
+    libc.fclose.restype = c_int
+
+    return libc
+
+
+class opened(object):
+
+    """Context guard exposing Python file object as C FILE* stream.
+
+       Yields pointer to a stream opened on a duplicate of file descriptor
+       of given object so the object itself stays open. Position of the
+       Python file object is synchronized with the stream on entry and
+       restored from it on exit if the object is seekable. Objects without
+       ``fileno`` e.g. :class:`io.BytesIO` are not supported.
+
+       >>> with opened(sys.stdout, 'wb') as stream:
+       ...     c_call(image, ('write', 'file'), stream)
+    """
+
+    def __init__(self, fileobj, mode):
+        self.__fileobj = fileobj
+        self.__mode = mode
+        self.__stream = None
+        self.__seekable = False
+
+    def __enter__(self):
+        fileobj = self.__fileobj
+        libc = get_libc()
+
+        try:
+            fd = fileobj.fileno()
+        except (AttributeError, UnsupportedOperation):
+            template = formattable('{0} has no file descriptor')
+            raise PystaciaException(template.format(type(fileobj).__name__))
+
+        if hasattr(fileobj, 'flush') and 'w' in self.__mode:
+            fileobj.flush()
+
+        fd = dup(fd)
+
+        try:
+            position = fileobj.tell()
+        except (AttributeError, IOError, OSError, ValueError):
+            pass
+        else:
+            # buffered readers may be ahead of their logical position
+            try:
+                lseek(fd, position, SEEK_SET)
+            except OSError:
+                pass
+            else:
+                self.__seekable = True
+
+        stream = libc.fdopen(fd, b(self.__mode))
+        if not stream:
+            close(fd)
+            raise PystaciaException('Could not open FILE* stream')
+
+        self.__stream = stream
+
+        return stream
+
+    def __exit__(self, type, value, traceback):  # @ReservedAssignment
+        libc = get_libc()
+        stream = self.__stream
+        self.__stream = None
+
+        libc.fflush(stream)
+        position = libc.ftell(stream)
+        # closes duplicated descriptor only
+        libc.fclose(stream)
+
+        if self.__seekable and position >= 0:
+            self.__fileobj.seek(position)
+
+
+from os import dup, close, lseek, SEEK_SET
+from io import UnsupportedOperation
+from ctypes import c_int, c_long, c_char_p
+
+from six import b
+
+from pystacia.util import get_osname, PystaciaException
+from pystacia.compat import formattable, jython
+from pystacia.api.compat import CDLL, c_void_p, find_library
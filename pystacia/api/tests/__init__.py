@@ -189,6 +189,10 @@ class GetDllTest(TestCase):
                                 lambda: get_dll(environ=environ,
                                                 isolated=True))
 
+    def test_library_path(self):
+        path = get_library_path(get_dll(False), 'MagickWandGenesis')
+        self.assertTrue(exists(path))
+
 
 class MockFactory(object):
     def __init__(self, throw=False):
@@ -203,5 +207,6 @@ class MockFactory(object):
 
 
 from pystacia.api import get_dll, dll_template, find_library
+from pystacia.api.compat import get_library_path
 from pystacia.compat import formattable
 from pystacia.util import PystaciaException
@@ -0,0 +1,63 @@
+# coding: utf-8
+
+# pystacia/api/tests/cache_tests.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+from os import listdir, utime
+from os.path import join
+from tempfile import mkdtemp
+from shutil import rmtree
+
+from pystacia.tests.common import TestCase
+
+
+class CacheTest(TestCase):
+    def setUp(self):
+        self.saved = getattr(cache, '__record'), getattr(cache, '__path')
+
+        tmproot = self.tmproot = mkdtemp()
+        self.environ = {'PYSTACIA_CACHE_DIR': join(tmproot, 'cache')}
+
+        dll = self.dll = join(tmproot, 'libFoo.so')
+        open(dll, 'w').close()
+
+    def tearDown(self):
+        setattr(cache, '__record', self.saved[0])
+        setattr(cache, '__path', self.saved[1])
+
+        rmtree(self.tmproot)
+
+    def test(self):
+        environ = self.environ
+        search = cache.fingerprint(['/usr/lib'], 'Foo', (2, 1))
+
+        self.assertEqual(cache.load(search, environ), None)
+        cache.start(search, self.dll)
+        cache.update(options={'QuantumDepth': '16'}, formats=['png'])
+        self.assertEqual(len(listdir(environ['PYSTACIA_CACHE_DIR'])), 1)
+
+        record = cache.load(search, environ)
+        self.assertEqual(record['dll'], self.dll)
+        self.assertEqual(cache.get('options'), {'QuantumDepth': '16'})
+        self.assertEqual(cache.get('formats'), ['png'])
+
+        other = cache.fingerprint(['/usr/local/lib'], 'Foo', (2, 1))
+        self.assertEqual(cache.load(other, environ), None)
+        self.assertEqual(cache.get('formats'), None)
+
+        utime(self.dll, (1, 1))
+        self.assertEqual(cache.load(search, environ), None)
+
+    def test_disabled(self):
+        environ = self.environ
+        environ['PYSTACIA_NO_CACHE'] = '1'
+        search = cache.fingerprint('Foo')
+
+        self.assertFalse(cache.is_enabled(environ))
+        self.assertEqual(cache.load(search, environ), None)
+
+
+from pystacia.api import cache
@@ -31,7 +31,21 @@ class Enum(TestCase):
         self.assertEqual(lookup('undefined', composite,
                                 version=(6, 6, 2, 10)), 0)
 
+    def test_resolve(self):
+        forward, reverse = resolve('composite', (6, 7, 2, 1))
 
-from pystacia.api.enum import lookup
+        self.assertEqual(forward['darken_intensity'], 66)
+        self.assertEqual(reverse[66], 'darken_intensity')
+        self.assertFalse('_version' in forward)
+        self.assertTrue(resolve('composite', (6, 7, 2, 1))[0] is forward)
+        self.assertEqual(resolve('composite', (2, 6)), ({}, {}))
+
+        composite = enum('composite')
+        self.assertEqual(reverse_lookup(composite, 66, (6, 7, 2, 1)),
+                         composite.darken_intensity)
+        self.assertEqual(reverse_lookup(composite, -1, (6, 7, 2, 1)), None)
+
+
+from pystacia.api.enum import lookup, reverse_lookup, resolve
 from pystacia.lazyenum import enum
 from pystacia.util import PystaciaException
@@ -0,0 +1,53 @@
+# coding: utf-8
+
+# pystacia/api/tests/ffi_tests.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+from pystacia.tests.common import TestCase, skipIf
+from pystacia.api.ffi import is_available
+
+
+class FfiTest(TestCase):
+    def test_declare(self):
+        self.assertEqual(declare('MagickGetImageWidth', (MagickWand_p,),
+                                 c_size_t),
+                         'size_t MagickGetImageWidth(uintptr_t);')
+        self.assertEqual(declare('MagickWandGenesis', (), None),
+                         'void MagickWandGenesis(void);')
+        self.assertEqual(declare('MagickGetException',
+                                 (MagickWand_p, POINTER(ExceptionType)),
+                                 c_void_p),
+                         None)
+
+    @skipIf(not is_available(), 'cffi is not installed')
+    def test_stub(self):
+        img = sample()
+
+        width = make_stub('image', ('get', 'width'))
+        self.assertEqual(width(img), img.width)
+
+        set_format = make_stub('magick', 'set_format')
+        self.assertRaises(PystaciaException,
+                          lambda: set_format(img, 'lolz'))
+        set_format(img, 'bmp')
+        self.assertEqual(make_stub('magick', 'get_format')(img), 'BMP')
+
+        clone = make_stub('wand', 'clone')(img)
+        self.assertTrue(isinstance(clone, MagickWand_p))
+        c_call('wand', 'destroy', clone)
+
+        self.assertEqual(make_stub('magick', 'get_exception'), None)
+
+        img.close()
+
+
+from ctypes import POINTER, c_void_p, c_size_t
+
+from pystacia.tests.common import sample
+from pystacia.api.ffi import declare, make_stub
+from pystacia.api.func import c_call
+from pystacia.api.type import MagickWand_p, ExceptionType
+from pystacia.util import PystaciaException
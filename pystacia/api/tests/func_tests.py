@@ -24,7 +24,25 @@ class FuncTest(TestCase):
                           lambda: get_c_method('magick', 'non_existant'))
         self.assertFalse(get_c_method('magick', 'non_existant', throw=False))
 
+    def test_stub(self):
+        img = sample()
+
+        width = bind(Image, ('get', 'width'))
+        self.assertIs(width, get_stub('image', ('get', 'width')))
+        self.assertEqual(width(img), img.width)
+        self.assertEqual(width(img), c_call_generic(img, ('get', 'width')))
+
+        set_format = bind('magick', 'set_format')
+        self.assertRaises(PystaciaException,
+                          lambda: set_format(img, 'lolz'))
+        set_format(img, 'bmp')
+        self.assertEqual(c_call('magick', 'get_format', img), 'BMP')
+
+        img.close()
+
 
 from pystacia.tests.common import sample
-from pystacia.api.func import c_call, get_c_method
+from pystacia.api.func import (
+    c_call, c_call_generic, get_c_method, get_stub, bind)
+from pystacia.image import Image
 from pystacia.util import PystaciaException
@@ -0,0 +1,96 @@
+# coding: utf-8
+
+# pystacia/api/tests/trace_tests.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+from os import close, remove
+from tempfile import mkstemp
+from json import loads
+
+from pystacia.tests.common import TestCase
+
+
+class TraceTest(TestCase):
+    def test_collector(self):
+        img = sample()
+
+        width = img.width
+
+        with Collector() as collector:
+            img.flip(axes.x)
+            img.rescale(32, 32)
+            self.assertRaises(PystaciaException,
+                              lambda: c_call('magick', 'set_format',
+                                             img, 'lolz'))
+
+        img.flip(axes.x)
+        img.close()
+
+        stats = collector.stats()
+        self.assertEqual(stats['MagickResizeImage']['count'], 1)
+        self.assertEqual(stats['MagickSetFormat']['errors'], 1)
+        self.assertEqual(sum(stats['MagickResizeImage']['histogram']
+                             .values()), 1)
+
+        summary = collector.summary()
+        self.assertTrue(summary['wall'] >= summary['calls'])
+
+        self.assertEqual(stats['MagickFlipImage']['count'], 1)
+
+        events = [e for e in collector.get_trace()['traceEvents']
+                  if e['name'] == 'MagickFlipImage']
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['ph'], 'X')
+        self.assertEqual(events[0]['args']['width'], width)
+
+        fd, path = mkstemp()
+        close(fd)
+        collector.export(path)
+        f = open(path)
+        self.assertTrue(loads(f.read())['traceEvents'])
+        f.close()
+        remove(path)
+
+    def test_reentrancy(self):
+        img = sample()
+        calls = []
+
+        class Nested(Hook):
+            def start(self, call):
+                calls.append(call.method)
+                # calls made by hooks are not traced
+                img.width
+
+        hook = Nested()
+        add_hook(hook)
+        try:
+            img.flip(axes.x)
+        finally:
+            remove_hook(hook)
+
+        img.flip(axes.x)
+        img.close()
+
+        self.assertEqual(calls, ['flip'])
+
+    def test_nested(self):
+        img = sample()
+
+        with Collector() as collector:
+            # color gets allocated and pushed within the call
+            img.fill(from_rgb(.5, .5, .5))
+
+        img.close()
+
+        self.assertEqual(sorted(collector.stats()), ['MagickColorizeImage'])
+
+
+from pystacia.tests.common import sample
+from pystacia.api.trace import Collector, Hook, add_hook, remove_hook
+from pystacia.api.func import c_call
+from pystacia.util import PystaciaException
+from pystacia.image import axes
+from pystacia.color import from_rgb
@@ -0,0 +1,32 @@
+# coding: utf-8
+
+# pystacia/api/tests/warmup_tests.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+from pystacia.tests.common import TestCase
+
+
+class WarmupTest(TestCase):
+    def test(self):
+        timings = warmup(['png', 'non_existant'],
+                         [('rescale', 8, 8), lambda i: i.flip(axes.x)])
+
+        for key in 'dll', 'symbols', 'enums':
+            self.assertTrue(timings[key] >= 0)
+
+        self.assertTrue(timings['formats']['png'] >= 0)
+        self.assertEqual(timings['formats']['non_existant'], None)
+        self.assertEqual([name for name, _ in timings['ops']],
+                         ['rescale', '<lambda>'])
+
+    def test_bind_all(self):
+        self.assertTrue(bind_all() > 0)
+        self.assertTrue(bind(Image, 'resize') is bind(Image, 'resize'))
+
+
+from pystacia.api.warmup import warmup, bind_all
+from pystacia.api.func import bind
+from pystacia.image import Image, axes
@@ -0,0 +1,287 @@
+# coding: utf-8
+
+# pystacia/api/trace.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Instrumentation of calls to MagickWand.
+
+   Hooks added with :func:`add_hook` are notified before and after every
+   call made through :func:`pystacia.api.func.c_call`. When no hooks are
+   installed calls are not affected at all. Calls made by hooks themselves
+   and calls nested in a traced call e.g. pushing color components of an
+   argument are not traced, their time counts towards the outer call.
+
+   >>> with Collector() as collector:
+   ...     image.rescale(256, 256)
+   >>> collector.export('trace.json')
+"""
+
+from __future__ import with_statement
+
+from threading import Lock, local
+
+
+class Call(object):
+
+    """Single call to MagickWand passed to hooks.
+
+       Carries api type, method as in :mod:`pystacia.api.metadata`, object
+       the call was made on, start time and elapsed seconds available when
+       the call returns. Exception raised by the call if any is stored in
+       ``exception``.
+    """
+
+    __slots__ = ('api_type', 'method', 'obj', 'thread', 'start', 'elapsed',
+                 'exception', '__size')
+
+    def __init__(self, api_type, method, obj):
+        self.api_type = api_type
+        self.method = method
+        self.obj = obj
+        self.thread = get_ident()
+        self.start = None
+        self.elapsed = None
+        self.exception = None
+        self.__size = False
+
+    @property
+    def name(self):
+        """Name of C function."""
+        return metadata[self.api_type]['format'](self.method)
+
+    @property
+    def size(self):
+        """Return dimensions of image the call is made on or ``None``.
+
+           Dimensions are read on first access so hooks interested in size
+           before the call has to access it in :meth:`Hook.start`.
+        """
+        if self.__size is False:
+            self.__size = _get_size(self.obj)
+
+        return self.__size
+
+
+def _get_size(obj):
+    if not isinstance(obj, Resource) or obj._api_type != 'image':
+        return None
+
+    if obj.closed or not get_stub('magick', 'get_number_images')(obj):
+        return None
+
+    return (get_stub('image', ('get', 'width'))(obj),
+            get_stub('image', ('get', 'height'))(obj))
+
+
+class Hook(object):
+
+    """Base class of hooks doing nothing."""
+
+    def start(self, call):
+        """Called with :class:`Call` before the call is made."""
+
+    def stop(self, call):
+        """Called with :class:`Call` after the call returns or raises."""
+
+
+def add_hook(hook):
+    """Install hook receiving all subsequent calls."""
+    with __lock:
+        func._hooks = func._hooks + (hook,)
+
+
+def remove_hook(hook):
+    """Uninstall previously installed hook."""
+    with __lock:
+        func._hooks = tuple(h for h in func._hooks if h is not hook)
+
+__lock = Lock()
+
+
+def dispatch(hooks, obj, method, function, args):
+    """Call function notifying hooks, used by :func:`c_call`."""
+    guard = __guard
+    if getattr(guard, 'active', False) or getattr(guard, 'depth', 0):
+        return function(*args)
+
+    if hasattr(obj.__class__, '_api_type'):
+        api_type = obj.__class__._api_type
+    else:
+        api_type = obj
+
+    call = Call(api_type, method, obj)
+    _notify(hooks, 'start', call)
+
+    call.start = timer()
+    guard.depth = 1
+    try:
+        return function(*args)
+    except:
+        call.exception = exc_info()[1]
+        raise
+    finally:
+        guard.depth = 0
+        call.elapsed = timer() - call.start
+        _notify(hooks, 'stop', call)
+
+
+def _notify(hooks, event, call):
+    guard = __guard
+    guard.active = True
+
+    try:
+        for hook in hooks:
+            try:
+                getattr(hook, event)(call)
+            except:
+                template = formattable('Hook {0} failed on {1}: {2}')
+                logger.warning(template.format(hook, event, exc_info()[1]))
+    finally:
+        guard.active = False
+
+__guard = local()
+
+
+class Collector(Hook):
+
+    """Hook aggregating timings per C function and recording trace events.
+
+       :param sizes: record dimensions of images calls are made on
+       :type sizes: ``bool``
+       :param events: maximum number of events kept for :meth:`export`
+       :type events: ``int``
+
+       Can be used as context guard installing itself for the duration of
+       ``with`` block or with :func:`add_hook` and :func:`remove_hook`.
+    """
+
+    def __init__(self, sizes=True, events=100000):
+        self.__sizes = sizes
+        self.__limit = events
+        self.__lock = Lock()
+        self.clear()
+
+    def clear(self):
+        """Forget collected data."""
+        with self.__lock:
+            self.__stats = {}
+            self.__events = []
+            self.__started = timer()
+
+    def start(self, call):
+        if self.__sizes:
+            call.size
+
+    def stop(self, call):
+        name = call.name
+        # logarithmic buckets of microseconds
+        bucket = 1
+        while bucket < call.elapsed * 1e6:
+            bucket *= 2
+
+        with self.__lock:
+            try:
+                stats = self.__stats[name]
+            except KeyError:
+                stats = self.__stats[name] = {
+                    'count': 0, 'total': 0, 'min': None, 'max': 0,
+                    'errors': 0, 'histogram': {}}
+
+            stats['count'] += 1
+            stats['total'] += call.elapsed
+            if stats['min'] is None or call.elapsed < stats['min']:
+                stats['min'] = call.elapsed
+            stats['max'] = max(stats['max'], call.elapsed)
+            if call.exception is not None:
+                stats['errors'] += 1
+
+            histogram = stats['histogram']
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+
+            if len(self.__events) < self.__limit:
+                self.__events.append((name, call.api_type, call.thread,
+                                      call.start, call.elapsed,
+                                      self.__sizes and call.size))
+
+    def stats(self):
+        """Return statistics per C function.
+
+           :rtype: ``dict``
+
+           Maps names of C functions to dictionaries with number of calls,
+           total, minimal and maximal seconds, number of errors and
+           histogram mapping upper bounds of buckets in microseconds to
+           number of calls.
+        """
+        with self.__lock:
+            return dict((name, dict(stats, histogram=dict(stats['histogram'])))
+                        for name, stats in self.__stats.items())
+
+    def summary(self):
+        """Return wall seconds of collection and seconds spent in calls.
+
+           Difference between the two is time spent in Python.
+        """
+        with self.__lock:
+            total = sum(s['total'] for s in self.__stats.values())
+            count = sum(s['count'] for s in self.__stats.values())
+
+            return {'wall': timer() - self.__started, 'calls': total,
+                    'count': count}
+
+    def get_trace(self):
+        """Return events in Chrome trace event format.
+
+           :rtype: ``dict``
+
+           Result can be loaded by ``chrome://tracing`` or Perfetto once
+           serialized as JSON.
+        """
+        with self.__lock:
+            events = list(self.__events)
+
+        process = getpid()
+        trace_events = []
+        for name, api_type, thread, start, elapsed, size in events:
+            event = {'name': name, 'cat': str(api_type), 'ph': 'X',
+                     'ts': start * 1e6, 'dur': elapsed * 1e6,
+                     'pid': process, 'tid': thread}
+            if size:
+                event['args'] = {'width': size[0], 'height': size[1]}
+
+            trace_events.append(event)
+
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def export(self, filename):
+        """Write Chrome trace JSON to file."""
+        with open(filename, 'w') as f:
+            dump(self.get_trace(), f)
+
+    def __enter__(self):
+        add_hook(self)
+        return self
+
+    def __exit__(self, type, value, traceback):  # @ReservedAssignment
+        remove_hook(self)
+
+
+from sys import exc_info
+from os import getpid
+from timeit import default_timer as timer
+from json import dump
+from logging import getLogger
+
+from six.moves._thread import get_ident
+
+from pystacia.compat import formattable
+from pystacia.common import Resource
+from pystacia.api import func
+from pystacia.api.func import get_stub
+from pystacia.api.metadata import data as metadata
+
+
+logger = getLogger('pystacia.api.trace')
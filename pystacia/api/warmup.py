@@ -0,0 +1,133 @@
+# coding: utf-8
+
+# pystacia/api/warmup.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Up front initialization for latency sensitive services.
+
+   Symbols are annotated, enumerations resolved and coder modules loaded on
+   first use which makes the first request served by a fresh process
+   noticeably slower. :func:`warmup` pays those costs at once.
+"""
+
+
+def warmup(formats=None, ops=None):
+    """Initialize library, bind symbols and load coders up front.
+
+       :param formats: formats which coders are loaded by encoding and
+         decoding tiny in-memory samples
+       :type formats: ``list`` of ``str``
+       :param ops: operations run on tiny sample image, callables accepting
+         an image or tuples of method name and its arguments
+       :type ops: iterable
+       :rtype: ``dict``
+
+       Returns seconds spent in each step under ``'dll'``, ``'symbols'``
+       and ``'enums'`` keys, ``'formats'`` maps formats to seconds or
+       ``None`` if coder could not be loaded and ``'ops'`` lists pairs of
+       operation names and seconds.
+
+       >>> timings = warmup(['jpeg', 'png'], [('rescale', 8, 8)])
+    """
+    timings = {}
+
+    start = timer()
+    get_dll()
+    magick.get_options()
+    magick.get_formats()
+    timings['dll'] = timer() - start
+
+    start = timer()
+    bind_all()
+    timings['symbols'] = timer() - start
+
+    start = timer()
+    for name in enum_data:
+        resolve(name)
+    timings['enums'] = timer() - start
+
+    timings['formats'] = {}
+    for format in formats or ():  # @ReservedAssignment
+        start = timer()
+        try:
+            load_coder(format)
+        except PystaciaException:
+            template = formattable('Could not load coder for {0}: {1}')
+            logger.warning(template.format(format, exc_info()[1]))
+            timings['formats'][format] = None
+        else:
+            timings['formats'][format] = timer() - start
+
+    timings['ops'] = []
+    for op in ops or ():
+        start = timer()
+        image = blank(16, 16)
+        try:
+            if callable(op):
+                name = getattr(op, '__name__', repr(op))
+                op(image)
+            else:
+                name = op[0]
+                getattr(image, name)(*op[1:])
+        finally:
+            image.close()
+        timings['ops'].append((name, timer() - start))
+
+    return timings
+
+
+def bind_all():
+    """Annotate every available symbol described in metadata.
+
+       Creates call stubs unless they are disabled. Symbols missing from
+       loaded version of MagickWand are skipped. Returns number of bound
+       symbols.
+    """
+    count = 0
+
+    for api_type, type_data in metadata.items():
+        for method in type_data['symbols']:
+            if not get_c_method(api_type, method, throw=False):
+                continue
+
+            if use_stubs():
+                get_stub(api_type, method)
+
+            count += 1
+
+    return count
+
+
+def load_coder(format):  # @ReservedAssignment
+    """Load encoder and decoder modules of format."""
+    image = blank(1, 1)
+    try:
+        blob = image.get_blob(format)
+    finally:
+        image.close()
+
+    # decoding a pixel is as cheap as pinging and prepares whole read path
+    read_blob(blob, format).close()
+
+
+from sys import exc_info
+from timeit import default_timer as timer
+from logging import getLogger
+
+from six import callable
+
+from pystacia.util import PystaciaException
+from pystacia.compat import formattable
+from pystacia import magick
+from pystacia.api import get_dll
+from pystacia.api.metadata import data as metadata
+from pystacia.api.func import get_c_method, get_stub, use_stubs
+from pystacia.api.enum import resolve
+from pystacia.api.enumdata import data as enum_data
+from pystacia.image import blank, read_blob
+
+
+logger = getLogger('pystacia.api.warmup')
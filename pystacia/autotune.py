@@ -0,0 +1,292 @@
+# coding: utf-8
+
+# pystacia/autotune.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Tuning number of threads ImageMagick operations run with.
+
+   Parallelism inside a single call pays off for large images while small
+   ones lose more on starting threads than they gain and are better
+   processed in parallel across images. :func:`calibrate` times key
+   operations at several sizes and thread counts and :func:`enable`
+   installs a hook setting thread resource limit before each of them
+   according to the resulting model. Models are stored in the directory
+   of :mod:`pystacia.api.cache` so calibration runs once per machine and
+   ImageMagick version.
+
+   >>> autotune.enable()
+   >>> image.gaussian_blur(3)
+
+   Thread limit is process wide so operations overlapping in several
+   threads may run with limit chosen for each other.
+"""
+
+from __future__ import with_statement, division
+
+from threading import Lock
+
+from pystacia.api.trace import Hook
+
+
+def get_cases():
+    """Return :class:`pystacia.bench.Case` instances calibrated by default.
+
+       Cases are keyed by names of image methods in
+       :mod:`pystacia.api.metadata` they dispatch to.
+    """
+    return {'resize': bench.op('rescale', factor=.5),
+            'gaussian_blur': bench.op('gaussian_blur', 3),
+            'composite': bench.with_other('overlay', .5),
+            'fx': bench.op('fx', 'u * 1/2')}
+
+
+def get_thread_counts(limit):
+    """Return powers of two lower than limit followed by limit."""
+    counts = []
+
+    count = 1
+    while count < limit:
+        counts.append(count)
+        count *= 2
+
+    return counts + [limit]
+
+
+def calibrate(sizes=(64, 256, 1024), threads=None, cases=None, number=3,
+              repeat=3, margin=.05, callback=None):
+    """Time cases at several sizes and thread counts and return model.
+
+       :param sizes: widths sample image is rescaled to
+       :param threads: thread counts to try, powers of two up to current
+         thread limit by default
+       :type threads: ``list`` of ``int``
+       :param cases: :class:`pystacia.bench.Case` instances keyed by
+         method names, :func:`get_cases` by default
+       :type cases: ``dict``
+       :param margin: fraction by which more threads have to be faster to
+         be chosen leaving CPUs free for parallelism across images
+       :type margin: ``float``
+       :param callback: called with method name, number of pixels and list
+         of seconds and thread counts of every size
+       :rtype: ``dict``
+    """
+    if threads is None:
+        threads = get_thread_counts(get_limits()['thread'])
+
+    if cases is None:
+        cases = get_cases()
+
+    ops = {}
+
+    for size in sizes:
+        image = bench.get_sample('wizard', size)
+        pixels = image.width * image.height
+
+        try:
+            for method, case in cases.items():
+                timings = []
+                for count in sorted(threads):
+                    with limits(threads=count):
+                        result = bench.measure(case, image, 1, number, repeat)
+
+                    timings.append((result['best'], count))
+
+                best = min(timings)[0]
+                count = min(c for t, c in timings if t <= best * (1 + margin))
+                ops.setdefault(method, []).append([pixels, count])
+
+                if callback:
+                    callback(method, pixels, timings)
+        finally:
+            image.close()
+
+    for entries in ops.values():
+        entries.sort()
+
+    return {'format': __format, 'meta': bench.get_meta(), 'ops': ops}
+
+__format = 1
+
+
+def get_threads(model, method, width, height):
+    """Return thread count model chooses for method or ``None``.
+
+       Uses entry calibrated at number of pixels closest on logarithmic
+       scale.
+    """
+    entries = model['ops'].get(method)
+    if not entries:
+        return None
+
+    pixels = max(1, width * height)
+
+    return min((abs(log(pixels / size)), count)
+               for size, count in entries)[1]
+
+
+def get_path(environ=None):
+    """Return path model of loaded ImageMagick is stored at."""
+    key = cache.fingerprint(magick.get_version_str(), magick.get_depth(),
+                            cpu_count(), get_dll()._name)
+
+    return join(cache.get_directory(environ),
+                'autotune-' + key[:16] + '.json')
+
+
+def load(path=None):
+    """Read stored model or return ``None`` if there's no valid one.
+
+       Model is not read from :func:`get_path` when cache is disabled.
+    """
+    if not path:
+        if not cache.is_enabled():
+            return None
+
+        path = get_path()
+
+    try:
+        with open(path) as f:
+            model = loads(f.read())
+    except (IOError, OSError, ValueError):
+        return None
+
+    if (not isinstance(model, dict) or model.get('format') != __format or
+            not isinstance(model.get('ops'), dict)):
+        logger.debug('Discarding invalid autotune model ' + path)
+        return None
+
+    return model
+
+
+def save(model, path=None):
+    """Store model.
+
+       Model is not written to :func:`get_path` when cache is disabled.
+    """
+    if not path:
+        if not cache.is_enabled():
+            return
+
+        path = get_path()
+
+    cache.write(path, dumps(model, indent=1, sort_keys=True))
+
+
+class _Tuner(Hook):
+    def __init__(self, model):
+        self.model = model
+        # ids of calls in flight and limit in effect before the first one
+        self.calls = set()
+        self.baseline = None
+        self.limit = None
+        self.lock = Lock()
+
+    def start(self, call):
+        if call.api_type != 'image' or call.method not in self.model['ops']:
+            return
+
+        size = call.size
+        if not size:
+            return
+
+        count = get_threads(self.model, call.method, *size)
+        if count is None:
+            return
+
+        with self.lock:
+            if not self.calls:
+                self.baseline = self.limit = get_limit('thread')
+
+            self.calls.add(id(call))
+
+            count = min(count, self.baseline)
+            if count != self.limit:
+                set_limits(threads=count)
+                self.limit = count
+
+    def stop(self, call):
+        with self.lock:
+            if id(call) not in self.calls:
+                return
+
+            self.calls.remove(id(call))
+
+            # overlapping calls restore only once the last one returns
+            if not self.calls and self.limit != self.baseline:
+                set_limits(threads=self.baseline)
+
+
+def enable(model=None, **kw):
+    """Start choosing thread count of calibrated operations.
+
+       :param model: model returned by :func:`calibrate`, loaded from
+         :func:`get_path` by default or calibrated and stored there when
+         missing
+       :type model: ``dict``
+
+       Other keywords are passed to :func:`calibrate`. Calibrated
+       operations run with at most the thread limit in effect when the
+       first of overlapping ones starts which is restored once the last
+       of them returns.
+    """
+    global __tuner
+
+    if model is None:
+        model = load()
+
+    if model is None:
+        # thread counts of previous model would skew timings
+        disable()
+        model = calibrate(**kw)
+
+        try:
+            save(model)
+        except (IOError, OSError):
+            template = formattable('Could not write autotune model: {0}')
+            logger.debug(template.format(exc_info()[1]))
+
+    with __lock:
+        if __tuner:
+            remove_hook(__tuner)
+
+        __tuner = _Tuner(model)
+        add_hook(__tuner)
+
+
+def disable():
+    """Stop choosing thread count."""
+    global __tuner
+
+    with __lock:
+        if __tuner:
+            remove_hook(__tuner)
+
+        __tuner = None
+
+
+def is_enabled():
+    """Check if thread count is being chosen."""
+    return __tuner is not None
+
+__tuner = None
+__lock = Lock()
+
+
+from sys import exc_info
+from os.path import join
+from math import log
+from multiprocessing import cpu_count
+from json import dumps, loads
+from logging import getLogger
+
+from pystacia import magick, bench
+from pystacia.compat import formattable
+from pystacia.magick import get_limit, get_limits, set_limits, limits
+from pystacia.api import get_dll, cache
+from pystacia.api.trace import add_hook, remove_hook
+
+
+logger = getLogger('pystacia.autotune')
@@ -0,0 +1,519 @@
+# coding: utf-8
+
+# pystacia/batch.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Parallel processing of many images.
+
+   :term:`ctypes` releases the :term:`GIL` for the duration of foreign
+   calls so :term:`ImageMagick` operations performed on different images
+   can run concurrently in threads.
+"""
+
+from __future__ import with_statement
+
+from threading import Thread, Condition, Lock
+
+
+class Result(object):
+
+    """Outcome of processing a single input.
+
+       Carries position of the input in the input sequence, input itself
+       and either value returned by pipeline or exception raised while
+       loading or processing the input.
+    """
+
+    def __init__(self, index, input, value=None,  # @ReservedAssignment
+                 exception=None):
+        self.index = index
+        self.input = input
+        self.value = value
+        self.exception = exception
+
+    @property
+    def ok(self):
+        """Check if input has been processed without errors."""
+        return self.exception is None
+
+    def get(self):
+        """Return value or raise exception caught while processing."""
+        if self.exception is not None:
+            raise self.exception
+
+        return self.value
+
+    def __repr__(self):
+        template = formattable('<{0}(index={1},ok={2}) object at {3}>')
+        return template.format(self.__class__.__name__, self.index,
+                               self.ok, hex(id(self)))
+
+
+def load(input, factory=None):  # @ReservedAssignment
+    """Return :class:`pystacia.image.Image` for given input.
+
+       :param input: file name, blob, buffer, stream or image
+       :param factory: Image subclass to use when instantiating objects
+       :rtype: :class:`pystacia.image.Image`
+
+       Text strings are treated as file names, bytes, buffers and
+       file-like objects as blobs. Images are returned as they are. On
+       Python 2 ``str`` is bytes so file names have to be ``unicode``.
+    """
+    if isinstance(input, Image):
+        return input
+    elif isinstance(input, text_type):
+        return read(input, factory=factory)
+
+    return read_blob(input, factory=factory)
+
+
+def estimate(input):  # @ReservedAssignment
+    """Return approximate number of bytes of pixel memory for input.
+
+       :param input: file name, blob, buffer or image
+       :rtype: ``int``
+
+       Files and blobs are pinged so only headers are parsed. Returns 0 for
+       inputs that can not be estimated like streams.
+    """
+    if isinstance(input, Image):
+        width, height = input.size
+    else:
+        try:
+            if isinstance(input, text_type):
+                info = ping(input)
+            elif isinstance(input, bytes) or is_buffer(input):
+                info = ping_blob(input)
+            else:
+                return 0
+        except PystaciaException:
+            return 0
+
+        width, height = info['width'], info['height']
+
+    return footprint(width, height)
+
+
+class budget(object):
+
+    """Memory budget shared by workers.
+
+       Acquiring blocks while total of acquired costs would exceed the
+       limit. Items larger than the whole limit are let through once
+       nothing else is acquired so they never starve.
+    """
+
+    def __init__(self, limit):
+        self.__limit = limit
+        self.__used = 0
+        self.__cancelled = False
+        self.__condition = Condition(Lock())
+
+    def acquire(self, cost):
+        """Wait until cost fits in the budget.
+
+           Returns ``False`` if the budget got cancelled while waiting.
+        """
+        with self.__condition:
+            while (not self.__cancelled and self.__used and
+                   self.__used + cost > self.__limit):
+                self.__condition.wait()
+
+            if self.__cancelled:
+                return False
+
+            self.__used += cost
+
+        return True
+
+    def release(self, cost):
+        with self.__condition:
+            self.__used -= cost
+            self.__condition.notify_all()
+
+    def cancel(self):
+        with self.__condition:
+            self.__cancelled = True
+            self.__condition.notify_all()
+
+    @property
+    def used(self):
+        return self.__used
+
+
+def map(pipeline, inputs, threads=None,  # @ReservedAssignment
+        ordered=True, memory=None, factory=None):
+    """Process inputs with pipeline in a pool of threads.
+
+       :param pipeline: callable accepting :class:`pystacia.image.Image`
+       :param inputs: iterable of file names, blobs, buffers or images
+       :param threads: number of worker threads, number of CPUs by default
+       :type threads: ``int``
+       :param ordered: yield results in order of inputs
+       :type ordered: ``bool``
+       :param memory: limit of pixel memory in bytes being processed at once
+       :type memory: ``int``
+       :param factory: Image subclass to use when instantiating objects
+       :rtype: generator of :class:`Result`
+
+       Loads every input with :func:`load`, passes it to pipeline and
+       yields :class:`Result` carrying returned value or exception.
+       Exceptions never stop processing of other inputs. Loaded images are
+       closed after pipeline returns unless the pipeline returns the image
+       itself. Inputs are consumed lazily so at most a few items per thread
+       are in flight. When memory is given inputs are pinged upfront and
+       processing of big images is delayed until enough of the budget gets
+       released.
+
+       >>> def thumbnail(image):
+       ...     return image.rescale(128, 128).get_blob('jpeg')
+       >>> for result in map(thumbnail, ['a.jpg', 'b.jpg'], threads=8):
+       ...     print(result.index, len(result.get()))
+    """
+    if not threads:
+        threads = cpu_count()
+
+    # initialize library in this thread so workers don't race for it
+    get_dll()
+
+    tasks = queue.Queue(threads * 2)
+    results = queue.Queue()
+    budget_ = budget(memory) if memory else None
+    stopped = []
+
+    def feed():
+        try:
+            for index, input in enumerate(inputs):  # @ReservedAssignment
+                if stopped:
+                    break
+
+                cost = 0
+                if budget_:
+                    cost = estimate(input)
+                    if not budget_.acquire(cost):
+                        break
+
+                tasks.put((index, input, cost))
+        except:
+            results.put(Result(None, None, exception=exc_info()[1]))
+
+        for _ in range(threads):
+            tasks.put(None)
+
+    def work():
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+
+            index, input, cost = task  # @ReservedAssignment
+            result = Result(index, input)
+            try:
+                if not stopped:
+                    result.value = process(pipeline, input, factory)
+            except:
+                result.exception = exc_info()[1]
+
+            if budget_:
+                budget_.release(cost)
+
+            results.put(result)
+
+        results.put(None)
+
+    workers = [Thread(target=work) for _ in range(threads)]
+    workers.append(Thread(target=feed))
+
+    for worker in workers:
+        worker.daemon = True
+        worker.start()
+
+    pending = {}
+    expected = 0
+    running = threads
+
+    try:
+        while running:
+            result = results.get()
+
+            if result is None:
+                running -= 1
+                continue
+
+            if result.index is None:
+                # iterating inputs failed
+                raise result.exception
+
+            if not ordered:
+                yield result
+                continue
+
+            pending[result.index] = result
+            while expected in pending:
+                yield pending.pop(expected)
+                expected += 1
+    finally:
+        stopped.append(True)
+
+        if budget_:
+            budget_.cancel()
+
+        # unblock feeder and let workers drain remaining tasks
+        while running:
+            if results.get() is None:
+                running -= 1
+
+
+def process(pipeline, input, factory=None):  # @ReservedAssignment
+    """Load input, run pipeline on it and return its result.
+
+       Image loaded from input is closed afterwards unless pipeline
+       returns it. Images passed as inputs are never closed.
+    """
+    image = load(input, factory)
+
+    try:
+        value = pipeline(image)
+    except:
+        if image is not input:
+            image.close()
+        raise
+
+    if image is not input and value is not image and not image.closed:
+        image.close()
+
+    return value
+
+
+class ProcessPool(object):
+
+    """Pool of worker processes with initialized :term:`ImageMagick`.
+
+       :param processes: number of worker processes, number of CPUs by
+         default
+       :type processes: ``int``
+       :param formats: formats which coders are loaded upfront in workers
+       :type formats: ``list`` of ``str``
+
+       Workers are spawned rather than forked since :term:`ImageMagick`
+       thread pool does not survive forking. Each worker initializes
+       the library once and is reused for subsequent inputs. Inputs and
+       outputs travel between processes pickled, images in form of blobs,
+       so pipelines have to be importable module level functions. Use with
+       ``with`` statement or call :meth:`close` to stop workers.
+
+       >>> with ProcessPool(8, formats=['jpeg']) as pool:
+       ...     for result in pool.map(thumbnail, ['a.jpg', 'b.jpg']):
+       ...         print(result.index, len(result.get()))
+    """
+
+    def __init__(self, processes=None, formats=None):
+        try:
+            context = multiprocessing.get_context('spawn')
+        except AttributeError:
+            # python without start methods forks everywhere but windows
+            if get_osname() != 'windows' and getattr(get_dll, '__dll', None):
+                raise PystaciaException('Process pool has to be created '
+                                        'before MagickWand is initialized')
+            context = multiprocessing
+
+        self.__processes = processes or cpu_count()
+        self.__pool = context.Pool(self.__processes, _init_worker,
+                                   (formats,))
+
+    def map(self, pipeline, inputs, format='miff',  # @ReservedAssignment
+            ordered=True, chunksize=1, window=None):
+        """Process inputs with pipeline in worker processes.
+
+           :param pipeline: picklable callable accepting
+             :class:`pystacia.image.Image`
+           :param inputs: iterable of file names, blobs or images
+           :param format: format of blobs transferring images
+           :type format: ``str``
+           :param ordered: yield results in order of inputs
+           :type ordered: ``bool``
+           :param chunksize: number of inputs sent to worker at once
+           :type chunksize: ``int``
+           :param window: number of chunks in flight, twice the number of
+             processes by default
+           :type window: ``int``
+           :rtype: generator of :class:`Result`
+
+           Works like :func:`map` except images passed as inputs and
+           returned by pipeline are encoded as blobs in given format.
+           Buffers are copied into ``bytes`` before being sent. Inputs are
+           consumed and encoded lazily so at most window chunks are sent
+           and not yet yielded. Inputs failing to encode and values that
+           can not be sent back are reported in their :class:`Result`.
+        """
+        if not window:
+            window = self.__processes * 2
+
+        # nothing can be sent without it so fail early
+        dumps(pipeline)
+
+        inputs = enumerate(inputs)
+        done = queue.Queue()
+        # original inputs sent and not yet yielded
+        originals = {}
+        pending = {}
+        expected = 0
+        running = 0
+        exhausted = False
+
+        while True:
+            while not exhausted and len(originals) < window * chunksize:
+                tasks = []
+                failed = []
+                for index, item in islice(inputs, chunksize):
+                    originals[index] = item
+                    try:
+                        tasks.append((index, _to_transport(item, format)))
+                    except:
+                        failed.append((index, None, exc_info()[1]))
+
+                if not tasks and not failed:
+                    exhausted = True
+                    break
+
+                if failed:
+                    done.put(failed)
+                    running += 1
+
+                if tasks:
+                    kw = {'callback': done.put}
+                    if PY3:
+                        # otherwise chunk failing outside of _run is never
+                        # put and results are awaited forever
+                        kw['error_callback'] = _fail_chunk(done, tasks)
+
+                    self.__pool.apply_async(_run_chunk,
+                                            (pipeline, tasks, format), **kw)
+                    running += 1
+
+            if not running:
+                break
+
+            chunk = done.get()
+            running -= 1
+
+            for index, value, exception in chunk:
+                if not ordered:
+                    yield Result(index, originals.pop(index), value,
+                                 exception)
+                    continue
+
+                pending[index] = value, exception
+                while expected in pending:
+                    value, exception = pending.pop(expected)
+                    yield Result(expected, originals.pop(expected), value,
+                                 exception)
+                    expected += 1
+
+    def close(self):
+        """Stop workers after they finish pending work."""
+        self.__pool.close()
+        self.__pool.join()
+
+    def terminate(self):
+        """Stop workers immediately."""
+        self.__pool.terminate()
+        self.__pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):  # @ReservedAssignment
+        self.close()
+
+
+def _to_transport(input, format):  # @ReservedAssignment
+    if isinstance(input, Image):
+        return input.get_blob(format)
+    elif isinstance(input, (text_type, bytes)):
+        return input
+    elif is_buffer(input):
+        return memoryview(input).tobytes()
+    elif hasattr(input, 'read'):
+        return input.read()
+
+    return input
+
+
+def _init_worker(formats):
+    get_dll()
+
+    # workers leave with os._exit so atexit handlers never run
+    Finalize(None, shutdown, exitpriority=100)
+
+    for format in formats or ():  # @ReservedAssignment
+        # first use of a format loads its coder module
+        image = blank(1, 1)
+        try:
+            read_blob(image.get_blob(format)).close()
+        except PystaciaException:
+            template = formattable('Could not preload coder for {0}')
+            logger.warning(template.format(format))
+        image.close()
+
+
+def _fail_chunk(done, tasks):
+    def callback(exception):
+        done.put([(index, None, exception) for index, _ in tasks])
+
+    return callback
+
+
+def _run_chunk(pipeline, tasks, format):  # @ReservedAssignment
+    return [_run(pipeline, index, input, format) for index, input in tasks]
+
+
+def _run(pipeline, index, input, format):  # @ReservedAssignment
+    try:
+        value = process(pipeline, input)
+
+        if isinstance(value, Image):
+            image, value = value, value.get_blob(format)
+            image.close()
+
+        # unpicklable value would fail the whole chunk on its way back
+        dumps(value)
+    except:
+        exception = exc_info()[1]
+
+        try:
+            dumps(exception)
+        except:
+            # exceptions that can't cross process boundary are simplified
+            exception = PystaciaException(repr(exception))
+
+        return index, None, exception
+
+    return index, value, None
+
+
+from sys import exc_info
+from itertools import islice
+from logging import getLogger
+import multiprocessing
+from multiprocessing import cpu_count
+from multiprocessing.util import Finalize
+from pickle import dumps
+
+from six import PY3, text_type
+from six.moves import queue
+
+from pystacia.util import PystaciaException, get_osname
+from pystacia.compat import formattable
+from pystacia.api import get_dll, shutdown
+from pystacia.api.buffer import is_buffer
+from pystacia.memory import footprint
+from pystacia.image import (Image, read, read_blob, ping, ping_blob,
+                            blank)
+
+
+logger = getLogger('pystacia.batch')
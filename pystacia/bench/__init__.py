@@ -0,0 +1,354 @@
+# coding: utf-8
+
+# pystacia/bench/__init__.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Benchmarks of :class:`pystacia.image.Image` operations.
+
+   Every case is timed on sample images of several sizes in one or more
+   threads. Results can be saved as JSON and compared against a baseline
+   to catch performance regressions. Run ``python -m pystacia.bench
+   --help`` for command line usage.
+"""
+
+from __future__ import with_statement, division
+
+
+class Case(object):
+
+    """Single benchmarked operation.
+
+       :param name: name of the case
+       :type name: ``str``
+       :param run: callable performing timed operation on prepared value
+       :param setup: callable preparing value from sample image, untimed,
+         copies the sample by default
+
+       Resources returned by setup and run are closed after timing.
+    """
+
+    def __init__(self, name, run, setup=None):
+        self.name = name
+        self.run = run
+        self.setup = setup or (lambda image: image.copy())
+
+    def __repr__(self):
+        template = formattable('<{0}({1}) object at {2}>')
+        return template.format(self.__class__.__name__, self.name,
+                               hex(id(self)))
+
+
+def op(name, *args, **kw):
+    """Return :class:`Case` calling method of a copy of sample image."""
+    return Case(name, lambda image: getattr(image, name)(*args, **kw))
+
+
+def with_other(name, scale=1, *args):
+    """Return :class:`Case` calling method with scaled sample as argument."""
+    def setup(image):
+        other = image.copy()
+        if scale != 1:
+            other.rescale(factor=scale)
+
+        return image.copy(), other
+
+    return Case(name, lambda images: getattr(images[0], name)(images[1],
+                                                               *args),
+                setup)
+
+
+def get_blob(format):  # @ReservedAssignment
+    return Case('get_blob:' + format, lambda image: image.get_blob(format))
+
+
+def read_blob(format):  # @ReservedAssignment
+    return Case('read_blob:' + format,
+                lambda blob: image_module.read_blob(blob, format),
+                lambda image: image.get_blob(format))
+
+
+def get_cases(formats=None):
+    """Return list of all :class:`Case` instances.
+
+       :param formats: formats to benchmark encoding and decoding of, those
+         of :data:`default_formats` supported by loaded ImageMagick by
+         default
+       :type formats: ``list`` of ``str``
+    """
+    if formats is None:
+        supported = magick.get_formats()
+        formats = [f for f in default_formats if f in supported]
+
+    cases = [
+        op('copy'),
+        op('rescale', factor=.5),
+        Case('rescale:up', lambda image: image.rescale(factor=2)),
+        op('fit', 64, 64),
+        op('thumbnail', 64, 64),
+        Case('resize', lambda image: image.resize(image.width // 2,
+                                                  image.height // 2)),
+        op('rotate', 30),
+        op('flip', axes.x),
+        op('transpose'),
+        op('transverse'),
+        op('skew', 10),
+        op('roll', 10, 10),
+        op('straighten', .5),
+        op('trim'),
+        op('chop', 0, 0, 10, 10),
+        op('splice', 10, 10, 10, 10),
+        op('brightness', .5),
+        op('contrast', .5),
+        op('gamma', 1.5),
+        op('auto_gamma'),
+        op('auto_level'),
+        op('modulate', .1, -.2, .1),
+        op('desaturate'),
+        op('colorize', 'red'),
+        op('sepia'),
+        op('equalize'),
+        op('normalize'),
+        op('invert'),
+        op('solarize', .5),
+        op('posterize', 4),
+        op('threshold', .5),
+        with_other('map', .25),
+        op('contrast_stretch', .1, .9),
+        op('evaluate', 'multiply', .5),
+        Case('total_colors', lambda image: image.total_colors),
+        op('get_range'),
+        op('blur', 3),
+        op('motion_blur', 3),
+        op('gaussian_blur', 3),
+        op('adaptive_blur', 3),
+        op('adaptive_sharpen', 3),
+        op('detect_edges', 3),
+        op('radial_blur', 10),
+        op('sharpen', 3),
+        op('denoise'),
+        op('despeckle'),
+        op('emboss'),
+        op('swirl', 60),
+        op('wave', 20, 100),
+        op('sketch', 3),
+        op('add_noise'),
+        op('charcoal', 3),
+        op('oil_paint', 3),
+        op('shade'),
+        op('spread', 2),
+        op('fx', 'u * 1/2'),
+        op('get_pixel', 10, 10),
+        op('export_pixels'),
+        Case('import_pixels',
+             lambda args: args[0].import_pixels(args[1]),
+             lambda image: (image.copy(), image.export_pixels())),
+        op('fill', 'red', .5),
+        op('set_color', 'red'),
+        op('set_alpha', .5),
+        with_other('overlay', .5),
+        with_other('compare'),
+        with_other('is_same'),
+        op('convert_colorspace', colorspaces.gray),
+        op('checkerboard'),
+    ]
+
+    cases.extend(get_blob(format) for format in formats)
+    cases.extend(read_blob(format) for format in formats)
+
+    return cases
+
+
+def get_sample(name, width=None):
+    """Return sample image rescaled to given width keeping aspect ratio.
+
+       :param name: one of ``'lena'``, ``'rose'``, ``'wizard'`` or
+         ``'logo'``
+       :type name: ``str``
+    """
+    image = sample_factories[name]()
+
+    if width:
+        height = max(1, int(round(image.height * width / image.width)))
+        image.rescale(width, height)
+
+    return image
+
+
+def measure(case, image, threads=1, number=3, repeat=3):
+    """Time case on image.
+
+       :rtype: ``dict``
+
+       Runs case ``number`` times in each of threads and repeats it
+       ``repeat`` times. Returns best and mean wall time per single
+       operation in seconds so with more threads it measures throughput.
+    """
+    timings = []
+
+    for _ in range(repeat):
+        prepared = [[case.setup(image) for _ in range(number)]
+                    for _ in range(threads)]
+        results = []
+
+        def work(values):
+            for value in values:
+                results.append(case.run(value))
+
+        workers = [Thread(target=work, args=(values,))
+                   for values in prepared[1:]]
+
+        start = timer()
+        for worker in workers:
+            worker.start()
+        try:
+            work(prepared[0])
+        finally:
+            for worker in workers:
+                worker.join()
+            elapsed = timer() - start
+
+            # chainable methods return the prepared image itself
+            closed = set([id(image)])
+            for value in [v for values in prepared for v in values] + results:
+                _close(value, closed)
+
+        if len(results) != threads * number:
+            raise PystaciaException('Benchmark failed in worker thread')
+
+        timings.append(elapsed / (threads * number))
+
+    return {'best': min(timings), 'mean': sum(timings) / len(timings)}
+
+
+def _close(value, closed):
+    if isinstance(value, tuple):
+        for item in value:
+            _close(item, closed)
+    elif isinstance(value, Resource) and id(value) not in closed:
+        closed.add(id(value))
+        value.close()
+
+
+def run(cases=None, samples=('lena', 'rose', 'wizard', 'logo'),
+        sizes=(128, 512), threads=None, number=3, repeat=3, callback=None):
+    """Run benchmarks and return results.
+
+       :param cases: list of :class:`Case`, :func:`get_cases` by default
+       :param samples: names of sample images
+       :param sizes: widths samples are rescaled to, ``None`` for original
+       :param threads: thread counts to run with, 1 and number of CPUs by
+         default
+       :type threads: ``list`` of ``int``
+       :param callback: called with key and result of every measurement
+       :rtype: ``dict``
+
+       Results are keyed ``'case/sample@size/xthreads'``. Cases that fail
+       e.g. because of missing coder get ``'error'`` instead of timings.
+       Lena is skipped if not available in this install.
+    """
+    if cases is None:
+        cases = get_cases()
+
+    if threads is None:
+        threads = sorted(set([1, cpu_count()]))
+
+    results = {}
+
+    for name in samples:
+        if name == 'lena' and not lena_available():
+            continue
+
+        for size in sizes:
+            image = get_sample(name, size)
+            label = formattable('{0}@{1}').format(name, size or 'orig')
+
+            for case in cases:
+                for count in threads:
+                    key = '/'.join([case.name, label, 'x' + str(count)])
+
+                    try:
+                        result = measure(case, image, count, number, repeat)
+                    except:
+                        result = {'error': str(exc_info()[1])}
+
+                    results[key] = result
+                    if callback:
+                        callback(key, result)
+
+            image.close()
+
+    return {'meta': get_meta(), 'results': results}
+
+
+def get_meta():
+    """Return description of the environment benchmarks run in."""
+    return {'pystacia': pystacia.__version__,
+            'python': version.split()[0],
+            'implementation': platform.python_implementation(),
+            'magick': magick.get_version_str(),
+            'depth': magick.get_depth(),
+            'cpus': cpu_count()}
+
+
+def save(results, filename):
+    """Write results as JSON."""
+    with open(filename, 'w') as f:
+        dump(results, f, indent=1, sort_keys=True)
+
+
+def load(filename):
+    """Read results saved with :func:`save`."""
+    with open(filename) as f:
+        return loads(f.read())
+
+
+def compare(results, baseline, threshold=.1):
+    """Return regressions of results against baseline.
+
+       :param threshold: fraction by which best time has to grow to be
+         reported
+       :type threshold: ``float``
+       :rtype: ``list`` of ``tuple``
+
+       Returns sorted key, baseline seconds and current seconds of every
+       measurement present in both which got slower by more than
+       threshold.
+    """
+    regressions = []
+    old = baseline['results']
+
+    for key, result in results['results'].items():
+        if 'best' not in result or 'best' not in old.get(key, {}):
+            continue
+
+        if result['best'] > old[key]['best'] * (1 + threshold):
+            regressions.append((key, old[key]['best'], result['best']))
+
+    return sorted(regressions)
+
+
+from sys import exc_info, version
+from threading import Thread
+from timeit import default_timer as timer
+from multiprocessing import cpu_count
+from json import dump, loads
+import platform
+
+import pystacia
+from pystacia import magick
+from pystacia import image as image_module
+from pystacia.util import PystaciaException
+from pystacia.compat import formattable
+from pystacia.common import Resource
+from pystacia.image.enum import axes, colorspaces
+from pystacia.image.sample import (lena, lena_available, rose, wizard,
+                                   magick_logo)
+
+
+sample_factories = {'lena': lena, 'rose': rose, 'wizard': wizard,
+                    'logo': magick_logo}
+
+default_formats = ['png', 'jpeg', 'bmp', 'gif', 'tiff', 'webp']
@@ -0,0 +1,118 @@
+# coding: utf-8
+
+# pystacia/bench/__main__.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Command line interface of :mod:`pystacia.bench`.
+
+   Exits with status 1 when regressions against baseline are found::
+
+       python -m pystacia.bench -c 'rescale*' -o baseline.json
+       python -m pystacia.bench -c 'rescale*' -b baseline.json --threshold .2
+"""
+
+from __future__ import print_function
+
+
+def parse_list(value, type=str):  # @ReservedAssignment
+    return [type(x) for x in value.split(',') if x]
+
+
+def parse_size(value):
+    return None if value == 'orig' else int(value)
+
+
+def main(argv=None):
+    parser = OptionParser(usage='python -m pystacia.bench [options]')
+    parser.add_option('-c', '--case', action='append', default=[],
+                      help='run cases matching shell pattern, repeatable')
+    parser.add_option('-s', '--samples', default='lena,rose,wizard,logo',
+                      help='comma separated sample images [%default]')
+    parser.add_option('--sizes', default='128,512',
+                      help='comma separated widths, orig for original '
+                      'size [%default]')
+    parser.add_option('-t', '--threads',
+                      help='comma separated thread counts [1,CPUs]')
+    parser.add_option('-f', '--formats',
+                      help='comma separated formats for blob cases')
+    parser.add_option('-n', '--number', type='int', default=3,
+                      help='operations per thread in a run [%default]')
+    parser.add_option('-r', '--repeat', type='int', default=3,
+                      help='number of runs [%default]')
+    parser.add_option('-o', '--output', help='write JSON results to file')
+    parser.add_option('-b', '--baseline',
+                      help='compare with JSON results from file')
+    parser.add_option('--threshold', type='float', default=.1,
+                      help='slowdown reported as regression [%default]')
+    parser.add_option('-l', '--list', action='store_true',
+                      help='list cases and exit')
+    parser.add_option('-q', '--quiet', action='store_true',
+                      help='do not print timings')
+
+    options, _ = parser.parse_args(argv)
+
+    formats = options.formats
+    if formats is not None:
+        formats = parse_list(formats)
+
+    cases = get_cases(formats)
+    if options.case:
+        cases = [c for c in cases
+                 if [p for p in options.case if fnmatch(c.name, p)]]
+
+    if options.list:
+        for case in cases:
+            print(case.name)
+
+        return 0
+
+    def report(key, result):
+        if options.quiet:
+            return
+
+        if 'error' in result:
+            print(formattable('{0:<40} error: {1}').format(
+                key, result['error']))
+        else:
+            print(formattable('{0:<40} {1:>10.3f} ms {2:>10.3f} ms').format(
+                key, result['best'] * 1000, result['mean'] * 1000))
+
+    threads = options.threads
+    if threads is not None:
+        threads = parse_list(threads, int)
+
+    results = run(cases, parse_list(options.samples),
+                  parse_list(options.sizes, parse_size), threads,
+                  options.number, options.repeat, report)
+
+    if options.output:
+        save(results, options.output)
+
+    if options.baseline:
+        regressions = compare(results, load(options.baseline),
+                              options.threshold)
+
+        for key, old, new in regressions:
+            print(formattable('{0:<40} {1:>10.3f} ms -> {2:.3f} ms '
+                              '({3:+.0%})').format(key, old * 1000,
+                                                   new * 1000, new / old - 1))
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+from sys import exit
+from optparse import OptionParser
+from fnmatch import fnmatch
+
+from pystacia.compat import formattable
+from pystacia.bench import get_cases, run, save, load, compare
+
+
+if __name__ == '__main__':
+    exit(main())
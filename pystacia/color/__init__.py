@@ -10,6 +10,8 @@ from __future__ import division
 
 from six import integer_types, string_types
 
+from pystacia.util import memoized
+
 
 """Various color-related functions and objects."""
 
@@ -34,7 +36,8 @@ def from_string(value, factory=None):
        as in `CSS` 2.1. Supported formats include rgb, rgba, hsl, hsla,
        color identifiers, hexadecimal values, integer and percent values
        where applicable. When factory is specified this type
-       is used instead of default :class:`Color` type.
+       is used instead of default :class:`Color` type. Parsed strings are
+       cached so repeating the same specification is cheap.
 
        >>> from_string('red')
        <Color(r=1,g=0,b=0,a=1) object at 0x10320e400L>
@@ -141,7 +144,7 @@ from pystacia.common import Resource
 from pystacia.compat import formattable
 
 
-def _make_component(name):
+def _make_component(name, index):
     doc = formattable("""Set or get {0} channel information.
 
        The value ought to be a float between 0 and 1.
@@ -150,45 +153,111 @@ def _make_component(name):
     """).format(name)
 
     def fget(self):
-        return getattr(impl, 'get_' + name)(self)
+        return self.get_rgba()[index]
 
     def fset(self, value):
-        getattr(impl, 'set_' + name)(self, value)
+        self._set_component(index, value)
 
     return property(fget, fset, doc=doc)
 
 
 class Color(Resource):
 
-    """Object representing color information."""
+    """Object representing color information.
+
+       Components are kept as plain floats. PixelWand is allocated only
+       when color is passed to a C function for the first time and reused
+       afterwards. Frozen colors are immutable and hashable.
+    """
+
+    __slots__ = ('__rgba', '__synced', '__frozen')
 
     _api_type = 'pixel'
 
+    _lazy = True
+
+    def __init__(self, resource=None):
+        # freshly allocated PixelWand is opaque black
+        self.__rgba = (0, 0, 0, 1) if resource is None else None
+        self.__synced = True
+        self.__frozen = False
+
+        super(Color, self).__init__(resource)
+
     def _alloc(self):
         return impl.alloc()
 
     def _free(self):
-        impl.free(self)
+        impl.free(super(Color, self).resource)
 
     def _clone(self):
         return impl.clone(self)
 
-    red = _make_component('red')
+    @property
+    def resource(self):
+        """Get underlying C resource.
+
+           Pushes components into PixelWand if they changed since last
+           access. Unless color is frozen components are read back from
+           PixelWand next time they are needed as C functions may modify it.
+        """
+        resource = super(Color, self).resource
+
+        if not self.__synced:
+            impl.push(resource, self.__rgba)
+            self.__synced = True
+
+        if not self.__frozen:
+            self.__rgba = None
+
+        return resource
+
+    def copy(self):
+        """Get independent copy of this color.
+
+           Copies are never frozen and don't allocate PixelWand until
+           needed.
+        """
+        color = self.__class__()
+        color.set_rgba(*self.__get_rgba())
+
+        return color
+
+    def freeze(self):
+        """Make color immutable and hashable.
+
+           :rtype: :class:`Color`
+
+           Returns the same instance so it can be used in expressions.
+           Changing components of frozen color raises
+           :class:`pystacia.util.PystaciaException`.
+        """
+        self.__get_rgba()
+        self.__frozen = True
+
+        return self
+
+    @property
+    def frozen(self):
+        """Check if color is immutable."""
+        return self.__frozen
+
+    red = _make_component('red', 0)
 
     r = red
     """Convenience synonym for :attr:`red`."""
 
-    green = _make_component('green')
+    green = _make_component('green', 1)
 
     g = green
     """Convenience synonym for :attr:`green`."""
 
-    blue = _make_component('blue')
+    blue = _make_component('blue', 2)
 
     b = blue
     """Convenience synonym for :attr:`blue`."""
 
-    alpha = _make_component('alpha')
+    alpha = _make_component('alpha', 3)
 
     a = alpha
     """Convenience synonym for :attr:`alpha`."""
@@ -221,6 +290,8 @@ class Color(Resource):
         return impl.get_hsl(self)
 
     def set_hsl(self, hue, saturation, lightness):
+        self.__check_frozen()
+
         return impl.set_hsl(self, hue, saturation, lightness)
 
     def get_int24(self):
@@ -240,7 +311,21 @@ class Color(Resource):
            Returns tuple containing red, green, blue and alpha channel
            information as numbers between 0 and 1.
         """
-        return self.get_rgb() + (self.a,)
+        return tuple(impl.saturate(x) for x in self.__get_rgba())
+
+    def __get_rgba(self):
+        # exact components, rounding is left to public getters
+        rgba = self.__rgba
+
+        if rgba is None:
+            # components are not known since C function had access to wand
+            rgba = impl.pull(super(Color, self).resource)
+            self.__rgba = rgba
+        elif self.closed:
+            tmpl = formattable('{0} already closed.')
+            raise PystaciaException(tmpl.format(self.__class__.__name__))
+
+        return rgba
 
     def set_rgb(self, r, g, b):
         """Set red, green and blue components all at once.
@@ -252,7 +337,7 @@ class Color(Resource):
            Components should be numbers between 0 and 1. Alpha component
            remains unchanged.
         """
-        self.r, self.g, self.b = r, g, b
+        self.set_rgba(r, g, b, self.__get_rgba()[3])
 
     def set_rgba(self, r, g, b, a):
         """Set red, green, blue and alpha components all at once.
@@ -264,8 +349,23 @@ class Color(Resource):
 
            Components should be numbers between 0 and 1.
         """
-        self.set_rgb(r, g, b)
-        self.a = a
+        self.__check_frozen()
+
+        if self.closed:
+            tmpl = formattable('{0} already closed.')
+            raise PystaciaException(tmpl.format(self.__class__.__name__))
+
+        self.__rgba = tuple(min(max(x, 0), 1) for x in (r, g, b, a))
+        self.__synced = not self.allocated and self.__rgba == (0, 0, 0, 1)
+
+    def _set_component(self, index, value):
+        rgba = list(self.__get_rgba())
+        rgba[index] = value
+        self.set_rgba(*rgba)
+
+    def __check_frozen(self):
+        if self.__frozen:
+            raise PystaciaException('Frozen color cannot be changed')
 
     def get_string(self):
         """Return string representation of color.
@@ -291,7 +391,14 @@ class Color(Resource):
            Usage and parameters identical to factory function
            :func:`from_string`.
         """
-        impl.set_string(self, value)
+        value = _normalize(value)
+
+        if _is_plain(value):
+            self.set_rgba(*_parse(value).__get_rgba())
+        else:
+            # PixelWand keeps more than RGBA e.g. black channel of CMYK
+            self.__check_frozen()
+            impl.set_string(self, value)
 
     @property
     def opaque(self):
@@ -326,7 +433,16 @@ class Color(Resource):
         return self.alpha == 0
 
     def __eq__(self, other):
-        return self.get_rgba() == cast(other).get_rgba()
+        return self.get_rgba() == _cast_input(other).get_rgba()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        if not self.__frozen:
+            raise TypeError('Only frozen colors are hashable')
+
+        return hash(self.get_rgba())
 
     def __str__(self):
         return self.get_string()
@@ -352,7 +468,43 @@ class Factory(object):
         return from_string(string)
 
 
+@memoized(maxsize=256)
+def _parse(value):
+    color = Color()
+    impl.set_string(color, value)
+
+    return color.freeze()
+
+
+def _normalize(value):
+    # spelling variants of the same color share an entry
+    return ''.join(value.split()).lower()
+
+
+def _is_plain(value):
+    """Check if normalized specification describes nothing but RGBA."""
+    parts = value.split('(', 1)
+
+    return len(parts) == 1 or parts[0] in _plain_functions
+
+_plain_functions = set(['rgb', 'rgba', 'srgb', 'srgba', 'hsl', 'hsla',
+                        'gray', 'graya'])
+
+
+def _intern(value):
+    """Return shared frozen :class:`Color` for string specification.
+
+       Not to be used directly.
+    """
+    return _parse(_normalize(value))
+
+
 def cast(value):
+    """Cast value to :class:`Color`.
+
+       Colors are returned as they are. Strings are parsed once and new
+       colors are made of cached components without calling ImageMagick.
+    """
     if isinstance(value, Color):
         return value
     elif isinstance(value, integer_types):
@@ -369,6 +521,18 @@ def cast(value):
     raise PystaciaException(template.format(value))
 
 
+def _cast_input(value):
+    """Cast value passed to C functions as input only.
+
+       Not to be used directly. Strings give shared frozen instances which
+       must be neither modified nor closed.
+    """
+    if isinstance(value, string_types):
+        return _intern(value)
+
+    return cast(value)
+
+
 from pystacia.color import _impl as impl
 from pystacia.util import PystaciaException
 
@@ -383,6 +547,13 @@ __exclusions = [
     'formattable',
     'impl',
     'PystaciaException',
+    'memoized',
+    '_parse',
+    '_normalize',
+    '_is_plain',
+    '_plain_functions',
+    '_intern',
+    '_cast_input',
     '__exclusions'
 ]
 
@@ -35,36 +35,19 @@ def set_string(color, value):
         reraise(*info)
 
 
-def get_red(color):
-    return saturate(c_call(color, 'get_red'))
+def pull(resource):
+    """Return components of PixelWand as tuple of floats."""
+    return tuple(c_call('pixel', 'get_' + name, resource)
+                 for name in components)
 
 
-def set_red(color, value):
-    c_call(color, 'set_red', value)
+def push(resource, rgba):
+    """Set components of PixelWand from tuple of floats."""
+    for name, value in zip(components, rgba):
+        c_call('pixel', 'set_' + name, resource, value)
 
 
-def get_green(color):
-    return saturate(c_call(color, 'get_green'))
-
-
-def set_green(color, value):
-    c_call(color, 'set_green', value)
-
-
-def get_blue(color):
-    return saturate(c_call(color, 'get_blue'))
-
-
-def set_blue(color, value):
-    c_call(color, 'set_blue', value)
-
-
-def get_alpha(color):
-    return saturate(c_call(color, 'get_alpha'))
-
-
-def set_alpha(color, value):
-    c_call(color, 'set_alpha', value)
+components = 'red', 'green', 'blue', 'alpha'
 
 
 def get_hsl(color):
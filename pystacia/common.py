@@ -8,7 +8,7 @@
 
 from __future__ import with_statement
 
-from threading import Lock
+from threading import RLock, local
 from weakref import WeakValueDictionary
 
 
@@ -66,11 +66,22 @@ class Resource(object):
        alive at the time program exits.
 
        Subclasses need to implement three methods: _alloc, _free and _copy to
-       conform to the interface.
+       conform to the interface. Subclasses setting _lazy allocate
+       underlying structures only when :attr:`resource` is accessed for the
+       first time.
     """
 
+    __slots__ = ('__resource', '__weakref__')
+
+    _lazy = False
+    """Postpone allocation until resource is needed."""
+
     def __init__(self, resource=None):
         """Construct new instance of resource."""
+        if resource is None and self._lazy:
+            self.__resource = _unallocated
+            return
+
         self.__resource = resource if resource is not None else self._alloc()
 
         if self.__resource is None:
@@ -79,6 +90,31 @@ class Resource(object):
 
         _track(self)
 
+    def __allocate(self):
+        resource = self._alloc()
+
+        if resource is None:
+            tmpl = formattable('{0} _alloc method returned None')
+            raise PystaciaException(tmpl.format(self.__class__.__name__))
+
+        # only publishing is guarded so allocations don't wait for each other
+        with _allocation_locks[id(self) % len(_allocation_locks)]:
+            published = self.__resource is _unallocated
+            if published:
+                self.__resource = resource
+
+        if published:
+            _track(self)
+        else:
+            # another thread won, free the spare through a throwaway owner
+            self.__class__(resource).close()
+
+    @property
+    def allocated(self):
+        """Check if underlying resource has been allocated."""
+        return self.__resource is not None and (
+            self.__resource is not _unallocated)
+
     def _claim(self, untrack=True):
         """Claim resource and close this instance.
 
@@ -88,6 +124,9 @@ class Resource(object):
 
            Not to be called directly under normal circumstances
         """
+        if self.__resource is _unallocated:
+            self.__allocate()
+
         self.__resource, resource = None, self.__resource
 
         if untrack:
@@ -110,8 +149,12 @@ class Resource(object):
         if resource is None:
             raise PystaciaException('Replacement resource cannot be None')
 
-        self._free()
-        self.__resource = resource
+        if self.__resource is _unallocated:
+            self.__resource = resource
+            _track(self)
+        else:
+            self._free()
+            self.__resource = resource
 
     def close(self, untrack=True):
         """Free resource and close the object
@@ -120,6 +163,10 @@ class Resource(object):
            the data immediately. It's also automatically called when you
            use with context protocol.
         """
+        if self.__resource is _unallocated:
+            self.__resource = None
+            return
+
         self._free()
         self._claim(untrack)
 
@@ -150,6 +197,9 @@ class Resource(object):
            can use with :term:`ctypes` calls directly. It can be useful
            when you want to perform custom operations.
         """
+        if self.__resource is _unallocated:
+            self.__allocate()
+
         if self.__resource is None:
             tmpl = formattable('{0} already closed.')
             raise PystaciaException(tmpl.format(self.__class__.__name__))
@@ -162,27 +212,96 @@ class Resource(object):
             self.close()
 
 
-_registry = WeakValueDictionary()
-"""Dictionary keeping references to all resources."""
+_unallocated = object()
+"""Marker of lazy resources not allocated yet."""
+
+# reentrant as __del__ of resources can run from within critical section
+_allocation_locks = [RLock() for _ in range(16)]
+
+
+class _Registry(object):
+
+    """Weak registry of resources split into independently locked shards.
+
+       Resources are spread over shards by their identity so threads
+       creating and closing resources rarely compete for the same lock.
+    """
+
+    def __init__(self, shards=16):
+        # reentrant as __del__ of resources can run from within
+        # critical section
+        self.__shards = [(WeakValueDictionary(), RLock())
+                         for _ in range(shards)]
+
+    def __shard(self, key):
+        # objects are aligned in memory so low bits of ids carry no entropy
+        return self.__shards[(key >> 4) % len(self.__shards)]
+
+    def add(self, resource):
+        key = id(resource)
+        data, lock = self.__shard(key)
+
+        with lock:
+            data[key] = resource
+
+    def discard(self, resource):
+        key = id(resource)
+        data, lock = self.__shard(key)
+
+        if key in data:
+            with lock:
+                data.pop(key, None)
+
+    def values(self):
+        """Return list of all tracked resources still alive."""
+        values = []
+
+        for data, lock in self.__shards:
+            with lock:
+                values.extend(data.values())
+
+        return values
+
+    def __len__(self):
+        return sum(len(data) for data, _ in self.__shards)
+
+
+_registry = _Registry()
+"""Registry keeping weak references to all resources."""
+
+
+class untracked(object):
+
+    """Context guard disabling tracking of resources.
+
+       Resources created in the current thread within the guarded block
+       are not registered for cleanup at exit which saves some overhead
+       in hot loops. Caller has to make sure all of them get closed
+       explicitly.
+
+       >>> with untracked():
+       ...     for x in range(1000):
+       ...         with Color.from_rgb(x / 1000, 0, 0) as color:
+       ...             image.fill(color)
+    """
+
+    def __enter__(self):
+        _tracking.depth = getattr(_tracking, 'depth', 0) + 1
+
+    def __exit__(self, type, value, traceback):  # @ReservedAssignment
+        _tracking.depth -= 1
 
 
-__lock = Lock()
+_tracking = local()
 
 
 def _track(resource):
-    key = id(resource)
-    if key not in _registry:
-        with __lock:
-            if key not in _registry:
-                _registry[key] = resource
+    if not getattr(_tracking, 'depth', 0):
+        _registry.add(resource)
 
 
 def _untrack(resource):
-    key = id(resource)
-    if key in _registry:
-        with __lock:
-            if key in _registry:
-                del _registry[key]
+    _registry.discard(resource)
 
 
 def _cleanup():
@@ -196,12 +315,11 @@ def _cleanup():
     alive = 0
     unclosed = 0
 
-    with __lock:
-        for obj in _registry.values():
-            alive += 1
-            if not obj.closed:
-                unclosed += 1
-                obj.close(untrack=False)
+    for obj in _registry.values():
+        alive += 1
+        if not obj.closed:
+            unclosed += 1
+            obj.close(untrack=False)
 
     msg = formattable('Alive weakrefs: {0}')
     logger.debug(msg.format(alive))
@@ -25,40 +25,52 @@ def _instantiate(factory):
     return registry.get('image_factory', override=factory)()
 
 
-def read(filename, factory=None):
+def read(filename, factory=None, hint_size=None):
     """Read :class:`Image` from filename.
 
        :param filename: file name to read
        :type filename: ``str``
        :param factory: Image subclass to use when instantiating objects
+       :param hint_size: smallest width and height needed after reading
+       :type hint_size: ``tuple``
        :rtype: :class:`Image`
 
        Reads file, determines its format and returns an :class:`Image`
        representing it. You can optionally pass factory parameter
        to use alternative :class:`Image` subclass.
 
+       Passing hint_size lets :term:`JPEG` decoder scale image down by 1/2,
+       1/4 or 1/8 while decoding which is much faster and takes less memory
+       than decoding full image. Resulting image is not smaller than the
+       hint but can be bigger so it still needs to be rescaled to the exact
+       size. Other formats ignore the hint.
+
        >>> read('example.jpg')
        <Image(w=512,h=512,8bit,rgb,truecolor) object at 0x10302ee00L>
+       >>> read('big.jpg', hint_size=(300, 200)).rescale(300, 200)
+       <Image(w=300,h=200,8bit,rgb,truecolor) object at 0x10302ee00L>
     """
     if not exists(filename):
         template = formattable('No such file or directory: {0}')
         raise IOError((2, template.format(filename)))
 
-    return io.read(filename, factory=factory)
+    return io.read(filename, factory=factory, hint_size=hint_size)
 
 
 def read_blob(blob, format=None,  # @ReservedAssignment
-              length=None, factory=None):
+              length=None, factory=None, hint_size=None):
     """Read :class:`Image` from a blob string or stream with a header.
 
-       :param blob: blob data string or stream
-       :type blob: ``str`` (Python 2.x) / ``bytes`` (Python 3.x) or
-         file-like object
+       :param blob: blob data string, buffer or stream
+       :type blob: ``str`` (Python 2.x) / ``bytes`` (Python 3.x), buffer
+         protocol object or file-like object
        :param format: container format such as :term:`JPEG` or :term:`BMP`
        :type format: ``str``
-       :param length: read maximum this bytes from stream
+       :param length: read maximum this bytes from stream or buffer
        :type length: ``int``
        :param factory: Image subclass to use when instantiating objects
+       :param hint_size: smallest width and height needed after reading
+       :type hint_size: ``tuple``
        :rtype: :class:`Image`
 
        Reads image from string or data stream that contains a valid file
@@ -72,24 +84,33 @@ def read_blob(blob, format=None,  # @ReservedAssignment
        guessed from the data itself. You can optionally pass factory parameter
        to use alternative :class:`Image` subclass.
 
+       Objects supporting buffer protocol such as ``bytearray``,
+       ``memoryview`` or ``mmap.mmap`` are passed to :term:`ImageMagick`
+       in place without copying. Memory mapping large files avoids keeping
+       another copy of the data in memory. Hint size works as described in
+       :func:`read`.
+
        >>> with file('example.jpg') as f:
        ...     img = read_blob(f)
        >>> img
        <Image(w=512,h=512,8bit,rgb,truecolor) object at 0x10302ee00L>
     """
-    if hasattr(blob, 'read'):
+    if is_buffer(blob):
+        if length is not None:
+            blob = memoryview(blob)[:length]
+    elif hasattr(blob, 'read'):
         blob = blob.read(length)
 
-    return io.read_blob(blob, format, factory)
+    return io.read_blob(blob, format, factory, hint_size)
 
 
 def read_raw(raw, format, width, height,  # @ReservedAssignment
              depth, factory=None):
     """Read :class:`Image` from raw string or stream.
 
-       :param raw: raw data string or stream
-       :type raw: ``str`` (Python 2.x) / ``bytes`` (Python 3.x) or
-         file-like object
+       :param raw: raw data string, buffer or stream
+       :type raw: ``str`` (Python 2.x) / ``bytes`` (Python 3.x), buffer
+         protocol object or file-like object
        :param format: raw pixel format eg. ``'RGB'``
        :type format: ``str``
        :param width: width of image in raw data
@@ -111,6 +132,57 @@ def read_raw(raw, format, width, height,  # @ReservedAssignment
     """
     return io.read_raw(raw, format, width, height, depth, factory)
 
+
+def read_from(fileobj, format=None, factory=None):  # @ReservedAssignment
+    """Read :class:`Image` from file-like object.
+
+       :param fileobj: open file, pipe or socket file object
+       :type fileobj: file-like object with ``fileno`` method
+       :param format: container format such as :term:`JPEG` or :term:`TIFF`
+       :type format: ``str``
+       :param factory: Image subclass to use when instantiating objects
+       :rtype: :class:`Image`
+
+       Decodes an image directly from a file descriptor of fileobj through
+       MagickReadImageFile. Unlike :func:`read_blob` data is streamed by the
+       coder and not read into memory first. Format is a hint for inputs
+       where it cannot be guessed from the data. Position of seekable
+       objects is left right after consumed data, pipes and sockets may be
+       read past the end of the image. Not supported on Windows and Jython.
+
+       >>> img = read_from(sys.stdin)
+    """
+    return io.read_from(fileobj, format, factory)
+
+
+def from_buffer(buffer, width, height, map='RGB',  # @ReservedAssignment
+                storage='char', factory=None):
+    """Create :class:`Image` from pixel data in a buffer.
+
+       :param buffer: pixel data
+       :type buffer: buffer protocol object
+       :param width: width of image in pixels
+       :type width: ``int``
+       :param height: height of image in pixels
+       :type height: ``int``
+       :param map: channel order e.g. ``'RGB'``, ``'RGBA'`` or ``'I'``
+       :type map: ``str``
+       :param storage: channel storage type
+       :type storage: :class:`pystacia.lazyenum.EnumValue`
+       :param factory: Image subclass to use when instantiating objects
+       :rtype: :class:`Image`
+
+       Creates an image of width and height pixels and imports pixel data
+       from buffer which can be any contiguous buffer protocol object like
+       ``bytes``, ``bytearray``, ``memoryview``, ``array.array`` or NumPy
+       array. The data is read in place without intermediate copies and
+       without going through a blob decoder. Storage is the same as in
+       :meth:`Image.export_pixels`.
+
+       >>> img = from_buffer(bytearray(b'\\xff\\x00\\x00'), 1, 1)
+    """
+    return io.from_buffer(buffer, width, height, map, storage, factory)
+
 from pystacia.common import Resource
 from pystacia.image._impl import alloc, clone, free
 
@@ -124,6 +196,23 @@ class Image(Resource):
 
     _free = free
 
+    def __init__(self, resource=None):
+        Resource.__init__(self, resource)
+
+        # copies are not accounted by calls made on them
+        if resource is not None:
+            memory.update(self)
+
+    def _claim(self, untrack=True):
+        memory.release(self)
+
+        return Resource._claim(self, untrack)
+
+    def _replace(self, resource):
+        Resource._replace(self, resource)
+
+        memory.update(self)
+
     def _set_state(self, key, value, enum=None):
         if enum:
             value = enum_lookup(value, enum)
@@ -170,8 +259,38 @@ class Image(Resource):
         io.write(
             self, filename, format, compression, quality, flatten, background)
 
+    def write_to(self, fileobj, format,  # @ReservedAssignment
+                 compression=None, quality=None, flatten=None,
+                 background=None):
+        """Write an image to file-like object.
+
+           :param fileobj: open file, pipe or socket file object
+           :type fileobj: file-like object with ``fileno`` method
+           :param format: file format
+           :type format: ``str``
+           :param compression: compression algorithm
+           :type compression: :class:`pystacia.lazyenum.EnumValue`
+           :param quality: output quality
+           :type quality: ``int``
+
+           Encodes an image directly into a file descriptor of fileobj
+           through MagickWriteImageFile. The encoded data is streamed by
+           the coder and never held in memory as a whole. Unlike
+           :meth:`write` the format has to be given explicitly. Position of
+           seekable objects is advanced past written data. Not supported on
+           Windows and Jython.
+
+           >>> img = blank(10, 10)
+           >>> img.write_to(sys.stdout, 'png')
+           >>> img.close()
+
+           This method can be chained.
+        """
+        io.write_to(
+            self, fileobj, format, compression, quality, flatten, background)
+
     def get_blob(self, format, compression=None,  # @ReservedAssignment
-                 quality=None, factory=None):
+                 quality=None, factory=None, buffer=False):
         """Return a blob representing an image
 
            :param format: format of the output such as :term:`JPEG`
@@ -179,7 +298,9 @@ class Image(Resource):
            :param compression: compression supported by format
            :type compression: :class:`pystacia.lazyenum.EnumValue`
            :param quality: output quality
-           :rtype: ``str`` (Python 2.x) / ``bytes`` (Python 3.x)
+           :param buffer: return buffer sharing memory with ImageMagick
+           :type buffer: ``bool``
+           :rtype: ``str`` (Python 2.x) / ``bytes`` (Python 3.x) or buffer
 
            Returns blob carrying data representing an image along its header
            in the given format. Compression is one of compression algorithms.
@@ -192,8 +313,14 @@ class Image(Resource):
            The details are in the `ImageMagick documentation
            <http://www.imagemagick.org/script/
            command-line-options.php#quality>`.
+
+           When buffer is ``True`` encoded data is not copied into ``bytes``.
+           Instead a buffer protocol object wrapping memory allocated by
+           ImageMagick is returned. It can be passed to :func:`memoryview`,
+           files or sockets directly. The memory is freed once the buffer
+           and all views of it are released.
         """
-        blob = io.get_blob(self, format, compression, quality)
+        blob = io.get_blob(self, format, compression, quality, buffer)
 
         if factory:
             blob = factory(blob)
@@ -216,8 +343,8 @@ class Image(Resource):
                     height=self.height,
                     depth=self.depth)
 
-    def rescale(self, width=None, height=None,
-                factor=None, filter=None, blur=1):  # @ReservedAssignment
+    def rescale(self, width=None, height=None, factor=None,
+                filter=None, blur=1, adaptive=None):  # @ReservedAssignment
         """Rescales an image to given dimensions.
 
            :param width: Width of resulting image
@@ -228,6 +355,8 @@ class Image(Resource):
            :type factor: ``float`` or ``tuple`` of ``float``
            :param filter: Scaling filter
            :type filter: :class:`pystacia.lazuenym.Enums`
+           :param adaptive: prescale large reductions
+           :type adaptive: ``bool``
 
            Rescales an image to a given width and height pixels. If one of the
            dimensions is set to ``None`` it gets automatically computed using
@@ -241,6 +370,15 @@ class Image(Resource):
            filter which is most adequate for the scaling you perform i.e. the
            one which preserves as much as possible detail and sharpness.
 
+           When adaptive is set, reducing an image 6 or more times first
+           averages it down to 3 times the target size with
+           MagickScaleImage and only then applies the filter. That makes
+           large reductions an order of magnitude faster with hardly
+           visible difference. Point and box filters are never prescaled.
+           Set ``adaptive_rescale`` registry key or
+           ``PYSTACIA_ADAPTIVE_RESCALE`` environment variable to enable it
+           by default.
+
            >>> img = read('example.jpg')
            >>> img.size
            (32L, 32L)
@@ -253,7 +391,7 @@ class Image(Resource):
 
            This method can be chained.
         """
-        geometry.rescale(self, width, height, factor, filter, blur)
+        geometry.rescale(self, width, height, factor, filter, blur, adaptive)
 
     def fit(self, width=None, height=None, mode=None, upscale=False,
             filter=None, blur=1):  # @ReservedAssignment
@@ -271,6 +409,45 @@ class Image(Resource):
         """
         geometry.fit(self, width, height, mode, upscale, filter, blur)
 
+    def thumbnail(self, width=None, height=None, mode=None,
+                  upscale=False, strip=True):
+        """Create thumbnail of an image.
+
+           :param width: maximum width in pixels
+           :type width: ``int``
+           :param height: maximum height in pixels
+           :type height: ``int``
+           :param mode: ``'in'`` to fit inside or ``'out'`` to cover the area
+           :type mode: ``str``
+           :param upscale: enlarge images smaller than requested size
+           :type upscale: ``bool``
+           :param strip: remove profiles and comments
+           :type strip: ``bool``
+
+           Scales an image preserving aspect ratio so it fits inside width
+           and height in ``'in'`` mode. In ``'out'`` mode an image covers
+           the whole area and the excess is cropped evenly from both sides
+           giving exactly width by height pixels. Uses MagickThumbnailImage
+           which samples big images down before applying resize filter
+           and is much faster than :meth:`rescale` for large reductions.
+           Profiles and comments are removed unless strip is ``False``
+           in which case plain :meth:`rescale` is used. Unlike :meth:`fit`
+           no background is added.
+
+           >>> img = read('example.jpg')
+           >>> img.size
+           (640L, 480L)
+           >>> img.thumbnail(128, 128)
+           >>> img.size
+           (128L, 96L)
+           >>> img.thumbnail(64, 64, 'out')
+           >>> img.size
+           (64L, 64L)
+
+           This method can be chained.
+        """
+        geometry.thumbnail(self, width, height, mode, upscale, strip)
+
     def resize(self, width, height, x=0, y=0):
         """Resize (crop) image to given dimensions.
 
@@ -955,6 +1132,70 @@ class Image(Resource):
         """
         return pixel.get_pixel(self, x, y, factory)
 
+    def export_pixels(self, x=0, y=0, width=None, height=None,
+                      map='RGBA', storage='char',  # @ReservedAssignment
+                      buffer=None):  # @ReservedAssignment
+        """Export pixel data of an area into a buffer.
+
+           :param x: x coordinate of exported area
+           :type x: ``int``
+           :param y: y coordinate of exported area
+           :type y: ``int``
+           :param width: width of exported area, defaults to image width
+           :type width: ``int``
+           :param height: height of exported area, defaults to image height
+           :type height: ``int``
+           :param map: channel order e.g. ``'RGB'``, ``'RGBA'`` or ``'I'``
+           :type map: ``str``
+           :param storage: channel storage type
+           :type storage: :class:`pystacia.lazyenum.EnumValue`
+           :param buffer: writable buffer to export into
+           :rtype: ``bytearray`` or buffer
+
+           Exports pixels of width and height area at ``(x, y)`` in a single
+           call. Each pixel consists of channels given by map, each stored
+           as one of ``'char'``, ``'short'``, ``'integer'``, ``'float'`` or
+           ``'double'`` values. Pixel data is written directly into buffer
+           which can be any writable contiguous buffer protocol object like
+           ``bytearray``, ``array.array`` or NumPy array. When buffer is not
+           given new ``bytearray`` is allocated. Returns the buffer.
+
+           >>> img = read('example.jpg')
+           >>> data = img.export_pixels(map='RGB')
+           >>> len(data) == img.width * img.height * 3
+           True
+        """
+        return pixel.export_pixels(self, x, y, width, height, map, storage,
+                                   buffer)
+
+    def import_pixels(self, buffer, x=0, y=0,  # @ReservedAssignment
+                      width=None, height=None,
+                      map='RGBA', storage='char'):  # @ReservedAssignment
+        """Import pixel data of an area from a buffer.
+
+           :param buffer: pixel data
+           :type buffer: buffer protocol object
+           :param x: x coordinate of imported area
+           :type x: ``int``
+           :param y: y coordinate of imported area
+           :type y: ``int``
+           :param width: width of imported area, defaults to image width
+           :type width: ``int``
+           :param height: height of imported area, defaults to image height
+           :type height: ``int``
+           :param map: channel order e.g. ``'RGB'``, ``'RGBA'`` or ``'I'``
+           :type map: ``str``
+           :param storage: channel storage type
+           :type storage: :class:`pystacia.lazyenum.EnumValue`
+
+           Replaces pixels of width and height area at ``(x, y)`` with
+           data read in place from any contiguous buffer protocol object.
+           Layout of the data is the same as in :meth:`export_pixels`.
+
+           This method can be chained.
+        """
+        pixel.import_pixels(self, buffer, x, y, width, height, map, storage)
+
     def fill(self, fill, blend=1):
         """Overlay color over whole image.
 
@@ -1279,7 +1520,9 @@ from pystacia.compat import formattable, gui_open
 from pystacia import color
 color_module = color
 from pystacia.api.func import c_call
+from pystacia.api.buffer import is_buffer
 from pystacia import magick
+from pystacia import memory
 from pystacia.api.enum import (lookup as enum_lookup,
                                reverse_lookup as enum_reverse_lookup)
 
@@ -1303,7 +1546,7 @@ from pystacia.image._impl.io import ping, ping_blob  # NOQA
 # convenience imports
 from pystacia.image.enum import (types, filters, colorspaces, # NOQA
                                  compressions, composites, axes, noises,
-                                 thresholds, fit_modes)
+                                 thresholds, fit_modes, storages)
 from pystacia.image.generic import (checkerboard, noise, # NOQA
                                     plasma)
 from pystacia.image.sample import (lena, magick_logo, rose, # NOQA
@@ -1328,8 +1571,10 @@ __exclusions = [
     'sample',
     'registry',
     'magick',
+    'memory',
     'enum_lookup',
     'enum_reverse_lookup',
+    'is_buffer',
     'chainable',
     'geometry',
     'color_impl',
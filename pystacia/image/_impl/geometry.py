@@ -21,7 +21,8 @@ def _proportionally(image, width, height):
     return width, height
 
 
-def rescale(image, width, height, factor, filter, blur):  # @ReservedAssignment
+def rescale(image, width, height, factor, filter,  # @ReservedAssignment
+            blur, adaptive=None):
     if not filter:
         filter = filters.undefined  # @ReservedAssignment
 
@@ -37,9 +38,34 @@ def rescale(image, width, height, factor, filter, blur):  # @ReservedAssignment
             factor = (factor, factor)
         width, height = width * factor[0], height * factor[1]
 
+    if not width or width < 1 or not height or height < 1:
+        template = formattable('Can not rescale to {0}x{1}')
+        raise PystaciaException(template.format(width, height))
+
+    if adaptive is None:
+        adaptive = registry.get('adaptive_rescale',
+                                environ.get('PYSTACIA_ADAPTIVE_RESCALE'))
+
+    if adaptive:
+        _prescale(image, width, height, filter)
+
     c_call(image, 'resize', width, height, enum_lookup(filter, filters), blur)
 
 
+def _prescale(image, width, height, filter):  # @ReservedAssignment
+    # averaging filters gain nothing from prescaling
+    if filters.cast(filter).name in ('point', 'box'):
+        return
+
+    ratio = min(image.width / width, image.height / height)
+
+    if ratio >= prescale_ratio:
+        # box averaging down to a few times the target keeps enough
+        # samples under the filter window so result can't be told apart
+        c_call(image, 'scale', int(width * prescale_margin),
+               int(height * prescale_margin))
+
+
 def _calculate_mode(image, width, height, mode):
     ratio = width / image.width
 
@@ -80,6 +106,41 @@ def fit(image, width, height, mode,
     image._replace(background)
 
 
+def thumbnail(image, width, height, mode, upscale, strip):
+    if not width and not height:
+        raise PystaciaException('Either width or height must be provided')
+
+    if not mode:
+        mode = 'in'
+
+    if not width or not height:
+        width, height = _proportionally(image, width, height)
+        mode = 'in'
+
+    ratios = width / image.width, height / image.height
+    ratio = max(ratios) if mode == 'out' else min(ratios)
+
+    width_, height_ = (max(int(round(image.width * ratio)), 1),
+                       max(int(round(image.height * ratio)), 1))
+
+    if width_ < image.width or height_ < image.height or upscale:
+        if strip:
+            # samples down first for big reductions and drops profiles
+            c_call(image, 'thumbnail', width_, height_)
+        else:
+            rescale(image, width_, height_, None, None, 1)
+    elif strip:
+        c_call(image, 'strip')
+
+    if mode == 'out':
+        width_, height_ = image.size
+        width, height = min(int(width), width_), min(int(height), height_)
+        x, y = (width_ - width) // 2, (height_ - height) // 2
+
+        if (width, height) != (width_, height_):
+            resize(image, width, height, x, y)
+
+
 def resize(image, width, height, x, y):
     c_call(image, 'crop', width, height, x, y)
 
@@ -159,9 +220,19 @@ def splice(image, x, y, width, height):
 def chop(image, x, y, width, height):
     c_call(image, 'chop', width, height, x, y)
 
+from os import environ
+
+from pystacia import registry
 from pystacia.image.enum import filters, axes
 from pystacia.util import PystaciaException
+from pystacia.compat import formattable
 from pystacia.api.enum import lookup as enum_lookup
 from pystacia.image.generic import blank
 from pystacia.api.func import c_call
 from pystacia.color import from_string, Color
+
+prescale_ratio = 6
+"""Smallest reduction ratio for which images get prescaled."""
+
+prescale_margin = 3
+"""Size of prescaled image relative to the target size."""
@@ -11,20 +11,32 @@ from __future__ import with_statement
 from os.path import splitext
 
 
-def read(spec, width=None, height=None, factory=None):
+def read(spec, width=None, height=None, factory=None, hint_size=None):
     image = _instantiate(factory)
 
     if width and height:
         c_call('magick', 'set_size', image, width, height)
 
+    _set_hint_size(image, hint_size)
+
     c_call(image, 'read', spec)
 
     return image
 
 
-def read_blob(blob, format, factory):  # @ReservedAssignment
+def _set_hint_size(image, hint_size):
+    if hint_size:
+        # lets libjpeg decode at reduced scale with DCT scaling
+        value = formattable('{0}x{1}').format(*hint_size)
+        c_call('magick', 'set_option', image, 'jpeg:size', value)
+
+
+def read_blob(blob, format, factory,  # @ReservedAssignment
+              hint_size=None):
     image = _instantiate(factory)
 
+    _set_hint_size(image, hint_size)
+
     #resource = image.resource
     #if format:
         # ensure we always get bytes
@@ -35,10 +47,7 @@ def read_blob(blob, format, factory):  # @ReservedAssignment
     #          lambda: cdll.MagickSetFormat(resource, format),
     #          template.format(format))
 
-    if hasattr(blob, 'read'):
-        blob = blob.read()
-
-    c_call(image, ('read', 'blob'), blob, len(blob))
+    _read_blob(image, blob)
 
     #if format:
     #    guard(resource,
@@ -56,19 +65,63 @@ def read_raw(raw, format, width, height,  # @ReservedAssignment
     format = format.upper()  # @ReservedAssignment
     c_call('magick', 'set_format', image, format)
 
-    if hasattr(raw, 'read'):
-        raw = raw.read()
+    _read_blob(image, raw)
+
+    return image
+
+
+def _get_data(blob):
+    # buffers like mmap are passed in place even though they can be read
+    if not is_buffer(blob) and hasattr(blob, 'read'):
+        blob = blob.read()
+
+    return blob
+
 
-    c_call(image, ('read', 'blob'), raw, len(raw))
+def _read_blob(image, blob):
+    with exported(_get_data(blob)) as (pointer, size):
+        c_call(image, ('read', 'blob'), pointer, size)
+
+
+def from_buffer(buffer, width, height, map,  # @ReservedAssignment
+                storage, factory):
+    image = _instantiate(factory)
+
+    # start with opaque canvas unless alpha gets imported
+    background = 'transparent' if 'A' in map.upper() else 'black'
+
+    try:
+        c_call(image, 'new', width, height, background)
+
+        depth = depths.get(storages.cast(storage).name)
+        if depth:
+            c_call(image, ('set', 'depth'), depth)
+
+        pixel.import_pixels(image, buffer, 0, 0, width, height, map, storage)
+    except:
+        image.close()
+        raise
 
     return image
 
 
-def write(image, filename, format,  # @ReservedAssignment
-          compression, quality, flatten, background):
-    if not format:
-        format = splitext(filename)[1][1:].lower()  # @ReservedAssignment
+def read_from(fileobj, format, factory):  # @ReservedAssignment
+    image = _instantiate(factory)
 
+    if format:
+        c_call('magick', 'set_format', image, format.upper())
+
+    try:
+        with opened(fileobj, 'rb') as stream:
+            c_call(image, ('read', 'file'), stream)
+    except:
+        image.close()
+        raise
+
+    return image
+
+
+def _flattened(image, format, flatten, background):  # @ReservedAssignment
     if flatten is None:
         flatten = (image.type.name.endswith('matte') and
                    format not in ('png', 'tiff', 'tif', 'bmp', 'gif'))
@@ -81,12 +134,33 @@ def write(image, filename, format,  # @ReservedAssignment
         background.overlay(image)
         image = background
 
+    return image
+
+
+def write(image, filename, format,  # @ReservedAssignment
+          compression, quality, flatten, background):
+    if not format:
+        format = splitext(filename)[1][1:].lower()  # @ReservedAssignment
+
+    image = _flattened(image, format, flatten, background)
+
     with state(image, format=format, compression_quality=quality):
         c_call(image, 'write', filename)
 
 
+def write_to(image, fileobj, format,  # @ReservedAssignment
+             compression, quality, flatten, background):
+    format = format.lower()  # @ReservedAssignment
+    image = _flattened(image, format, flatten, background)
+
+    with state(image, format=format, compression=compression,
+               compression_quality=quality):
+        with opened(fileobj, 'wb') as stream:
+            c_call(image, ('write', 'file'), stream)
+
+
 def get_blob(image, format, compression,  # @ReservedAssignment
-             quality):
+             quality, buffer=False):  # @ReservedAssignment
     with state(image, compression=compression, compression_quality=quality):
         format = format.upper()  # @ReservedAssignment
         old_format = c_call('magick', 'get_format', image)
@@ -95,14 +169,20 @@ def get_blob(image, format, compression,  # @ReservedAssignment
         size = c_size_t()
         result = c_call(image, ('get', 'blob'), byref(size))
 
-        #from nose.tools import set_trace; set_trace()
+        c_call('magick', 'set_format', image, old_format)
+
+        if buffer:
+            if not result:
+                template = formattable('Could not encode image as {0}')
+                raise PystaciaException(template.format(format))
+
+            # hand over ImageMagick memory instead of copying it
+            return Blob(result, size.value).get_buffer()
 
         blob = string_at(result, size.value)
 
         c_call('magick_', 'relinquish_memory', result)
 
-        c_call('magick', 'set_format', image, old_format)
-
         return blob
 
 
@@ -124,10 +204,8 @@ def ping(filename):
 def ping_blob(blob):
     image = _instantiate(None)
 
-    if hasattr(blob, 'read'):
-        blob = blob.read()
-
-    c_call(image, ('ping', 'blob'), blob, len(blob))
+    with exported(_get_data(blob)) as (pointer, size):
+        c_call(image, ('ping', 'blob'), pointer, size)
 
     result = {
         'width': image.width,
@@ -140,7 +218,15 @@ def ping_blob(blob):
 
 
 from pystacia.common import state
+from pystacia.util import PystaciaException
+from pystacia.compat import formattable
 from pystacia.image import _instantiate
 from pystacia.image.generic import blank
+from pystacia.image.enum import storages
+from pystacia.image._impl import pixel
 from pystacia.api.func import c_call
+from pystacia.api.buffer import Blob, exported, is_buffer
+from pystacia.api.stdio import opened
 from pystacia.api.compat import c_size_t, string_at, byref
+
+depths = {'char': 8, 'short': 16}
@@ -6,6 +6,8 @@
 # This module is part of Pystacia and is released under
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 
+from __future__ import with_statement
+
 
 def get_pixel(self, x, y, factory):
     color_ = color._instantiate(factory)
@@ -15,6 +17,60 @@ def get_pixel(self, x, y, factory):
     return color_
 
 
+def _get_area(image, x, y, width, height):
+    if width is None:
+        width = image.width - x
+    if height is None:
+        height = image.height - y
+
+    return width, height
+
+
+def _get_storage_size(storage):
+    try:
+        return sizeof(storage_types[storage.name])
+    except KeyError:
+        template = formattable('Unsupported storage {0}')
+        raise PystaciaException(template.format(storage.name))
+
+
+def export_pixels(image, x, y, width, height, map,  # @ReservedAssignment
+                  storage, buffer):  # @ReservedAssignment
+    width, height = _get_area(image, x, y, width, height)
+    storage = storages.cast(storage)
+
+    size = width * height * len(map) * _get_storage_size(storage)
+
+    if buffer is None:
+        buffer = bytearray(size)  # @ReservedAssignment
+
+    with exported(buffer, writable=True) as (pointer, length):
+        if length < size:
+            template = formattable('Buffer too small, {0} bytes required')
+            raise PystaciaException(template.format(size))
+
+        c_call(image, ('export', 'pixels'), x, y, width, height, map,
+               enum_lookup(storage, storages), pointer)
+
+    return buffer
+
+
+def import_pixels(image, buffer, x, y, width, height,  # @ReservedAssignment
+                  map, storage):  # @ReservedAssignment
+    width, height = _get_area(image, x, y, width, height)
+    storage = storages.cast(storage)
+
+    size = width * height * len(map) * _get_storage_size(storage)
+
+    with exported(buffer) as (pointer, length):
+        if length < size:
+            template = formattable('Buffer too small, {0} bytes required')
+            raise PystaciaException(template.format(size))
+
+        c_call(image, ('import', 'pixels'), x, y, width, height, map,
+               enum_lookup(storage, storages), pointer)
+
+
 def fill(image, fill, blend):
     # image magick ignores alpha setting of color
     # let's incorporate it into blend
@@ -71,11 +127,23 @@ def compare(image, other, metric, factory):
     return(factory(diff), distortion.value)
 
 
+from pystacia.util import PystaciaException
+from pystacia.compat import formattable
 from pystacia.api.func import get_c_method, c_call
 from pystacia.api.enum import lookup as enum_lookup
-from pystacia.api.compat import c_double, byref
-from pystacia.image.enum import metrics, composites
+from pystacia.api.buffer import exported
+from pystacia.api.compat import (
+    c_double, byref, sizeof, c_ubyte, c_ushort, c_uint, c_float)
+from pystacia.image.enum import metrics, composites, storages
 from pystacia.image import Image
 from pystacia.image.generic import blank
 from pystacia.color import from_rgb
 from pystacia import color
+
+storage_types = {
+    'char': c_ubyte,
+    'short': c_ushort,
+    'integer': c_uint,
+    'float': c_float,
+    'double': c_double
+}
@@ -21,3 +21,4 @@ thresholds = enum('threshold')
 interpolations = enum('interpolation')
 operations = enum('operation')
 fit_modes = enum('mode')
+storages = enum('storage')
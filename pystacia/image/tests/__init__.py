@@ -9,6 +9,8 @@
 from __future__ import division
 
 import sys
+from array import array
+from mmap import mmap, ACCESS_READ
 from threading import Thread
 from re import match
 from tempfile import mkstemp
@@ -16,6 +18,7 @@ from tempfile import mkstemp
 from six import b, BytesIO
 
 from pystacia.image import Image
+from pystacia.util import get_osname
 from pystacia.tests.common import TestCase, skipIf, expectedFailure
 
 
@@ -80,6 +83,53 @@ class WithFactory(TestCase):
         self.assertEqual(img.get_pixel(1, 1), color.from_string('white'))
         img.close()
 
+    def test_export_pixels(self):
+        img = blank(3, 2, color.from_string('red'))
+
+        data = img.export_pixels(map='RGB')
+        self.assertIsInstance(data, bytearray)
+        self.assertEqual(bytes(data), b('\xff\x00\x00') * 6)
+
+        buffer_ = bytearray(4)
+        self.assertIs(img.export_pixels(2, 1, 1, 1, buffer=buffer_), buffer_)
+        self.assertEqual(bytes(buffer_), b('\xff\x00\x00\xff'))
+
+        floats = array('f', [0] * 6)
+        img.export_pixels(map='I', storage='float', buffer=floats)
+        self.assertTrue(all(0 < x < 1 for x in floats))
+
+        self.assertRaisesRegexp(PystaciaException, 'too small',
+                                lambda: img.export_pixels(buffer=buffer_))
+        self.assertRaises(PystaciaException,
+                          lambda: img.export_pixels(buffer=b('\x00') * 24))
+
+        img.close()
+
+    def test_import_pixels(self):
+        data = b('\xff\x00\x00') * 6
+        for buffer_ in (data, bytearray(data), memoryview(data)):
+            img = from_buffer(buffer_, 3, 2)
+
+            self.assertEqual(img.size, (3, 2))
+            self.assertEqual(img.depth, 8)
+            self.assertEqual(img.get_pixel(2, 1), color.from_string('red'))
+            self.assertEqual(bytes(img.export_pixels(map='RGB')), data)
+
+            img.close()
+
+        img = blank(3, 2, color.from_string('red'))
+        img.import_pixels(array('B', [0, 0, 255, 255]), 1, 1, 1, 1)
+        self.assertEqual(img.get_pixel(1, 1), color.from_string('blue'))
+        self.assertEqual(img.get_pixel(0, 0), color.from_string('red'))
+
+        self.assertRaisesRegexp(PystaciaException, 'too small',
+                                lambda: img.import_pixels(b('\x00')))
+        self.assertRaisesRegexp(PystaciaException, 'contiguous',
+                                lambda: img.import_pixels(
+                                    memoryview(b('\x00') * 24)[::2]))
+
+        img.close()
+
 
 def _test_doesnot_explode(method, args=None, different=True):
     if not args:
@@ -119,6 +169,68 @@ class WithSample(TestCase):
             self.assertTrue(img.colorspace.name.endswith('rgb'))
             self.assertEqual(img.depth, 8)
 
+    def test_read_blob_buffer(self):
+        img = self.img
+
+        bmp = img.get_blob('bmp')
+
+        for i in (bytearray(bmp), memoryview(bmp)):
+            img2 = read_blob(i)
+
+            self.assertEqual(img2.size, sample_size)
+            self.assertEqual(img2.type, sample_type)
+
+        tmpname = mkstemp()[1] + '.bmp'
+        img.write(tmpname)
+
+        f = open(tmpname, 'rb')
+        mapped = mmap(f.fileno(), 0, access=ACCESS_READ)
+
+        self.assertEqual(read_blob(mapped).size, sample_size)
+        self.assertDictEqual(ping_blob(mapped), ping_blob(bmp))
+
+        mapped.close()
+        f.close()
+
+        self.assertEqual(read_blob(bmp + b('garbage'), length=len(bmp)).size,
+                         sample_size)
+
+    def test_hint_size(self):
+        img = self.img
+        width, height = sample_size
+
+        jpeg = img.get_blob('jpeg')
+        hint_size = width // 4, height // 4
+
+        img = read_blob(jpeg, hint_size=hint_size)
+        self.assertEqual(img.size, hint_size)
+        img.close()
+
+        tmpname = mkstemp()[1] + '.jpg'
+        self.img.write(tmpname)
+
+        img = read(tmpname, hint_size=(width // 4 - 1, height // 4 - 1))
+        self.assertEqual(img.size, hint_size)
+        img.close()
+
+        # other formats ignore the hint
+        img = read_blob(self.img.get_blob('png'), hint_size=hint_size)
+        self.assertEqual(img.size, sample_size)
+        img.close()
+
+    def test_get_blob_buffer(self):
+        img = self.img
+
+        bmp = img.get_blob('bmp')
+        buffer_ = img.get_blob('bmp', buffer=True)
+
+        view = memoryview(buffer_)
+        self.assertEqual(len(buffer_), len(bmp))
+        self.assertEqual(view.tobytes(), bmp)
+
+        del buffer_
+        self.assertEqual(view.tobytes(), bmp)
+
     def test_read(self):
         self.assertRaises(IOError, lambda: read('/non/existant.qwerty'))
 
@@ -148,6 +260,39 @@ class WithSample(TestCase):
         self.assertEqual(img.type, sample_type)
         img.close()
 
+    @skipIf(get_osname() == 'windows', 'FILE* streams not supported')
+    def test_write_to(self):
+        img = self.img
+
+        tmpname = mkstemp()[1] + '.bmp'
+        f = open(tmpname, 'w+b')
+        f.write(b('header'))
+        img.write_to(f, 'bmp')
+        end = f.tell()
+
+        f.seek(0)
+        self.assertEqual(f.read()[len('header'):end], img.get_blob('bmp'))
+
+        f.seek(len('header'))
+        img = read_from(f)
+        self.assertEqual(img.size, sample_size)
+        self.assertEqual(img.type, sample_type)
+        self.assertTrue(f.tell() >= end)
+        img.close()
+        f.close()
+
+        self.assertRaises(PystaciaException,
+                          lambda: self.img.write_to(BytesIO(), 'bmp'))
+
+        sizes = []
+        for compression in 'none', 'lzw':
+            f = open(tmpname, 'w+b')
+            self.img.write_to(f, 'tiff', compression=compression)
+            sizes.append(f.tell())
+            f.close()
+
+        self.assertTrue(sizes[1] < sizes[0])
+
     def test_rescale(self):
         img = self.img
 
@@ -160,12 +305,28 @@ class WithSample(TestCase):
 
         self.assertEqual(img.size, (128, 64))
         self.assertRaises(PystaciaException, lambda: img.rescale())
+        self.assertRaises(PystaciaException, lambda: img.rescale(0, 10))
+        self.assertRaises(PystaciaException,
+                          lambda: img.rescale(10, 0, adaptive=True))
 
         img.rescale(64)
         self.assertEqual(img.size, (64, 32))
         img.rescale(None, 64)
         self.assertEqual(img.size, (128, 64))
 
+    def test_rescale_adaptive(self):
+        img = self.img
+        width, height = sample_size[0] // 16, sample_size[1] // 16
+
+        reference = img.copy().rescale(width, height)
+        img.rescale(width, height, adaptive=True)
+        self.assertEqual(img.size, reference.size)
+
+        distortion = img.compare(reference, metrics.root_mean_squared_error)[1]
+        self.assertLess(distortion, 0.02)
+
+        reference.close()
+
     def test_fit(self):
         img = self.img
 
@@ -175,6 +336,27 @@ class WithSample(TestCase):
         img.fit(128, 128)
         self.assertEqual(img.size, (128, 128))
 
+    def test_thumbnail(self):
+        img = self.img
+        width, height = sample_size
+
+        img.thumbnail(width // 4, width // 4)
+        self.assertEqual(img.size, (width // 4, height // 4))
+
+        img.thumbnail(width)
+        self.assertEqual(img.size, (width // 4, height // 4))
+
+        img.thumbnail(width // 2, upscale=True)
+        self.assertEqual(img.size, (width // 2, height // 2))
+
+        img.thumbnail(32, 32, 'out')
+        self.assertEqual(img.size, (32, 32))
+
+        img.thumbnail(None, 16, strip=False)
+        self.assertEqual(img.size, (16, 16))
+
+        self.assertRaises(PystaciaException, lambda: img.thumbnail())
+
     def test_resize(self):
         img = self.img
 
@@ -653,7 +835,9 @@ class ThreadedTest(TestCase):
 
 from pystacia.util import PystaciaException
 from pystacia.image import (
-    read, read_raw, read_blob, types, colorspaces, blank, axes, checkerboard)
+    read, read_raw, read_blob, types, colorspaces, blank, axes, checkerboard,
+    from_buffer, ping_blob, read_from)
+from pystacia.image.enum import metrics
 from pystacia import color, registry, magick
 from pystacia.tests.common import sample, sample_type, sample_size
 from random import randint
@@ -7,6 +7,7 @@
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 
 from pystacia.util import memoized
+from pystacia.lazyenum import enum
 
 from os.path import dirname, join, exists
 try:
@@ -17,6 +18,17 @@ except ImportError:
 
 @memoized
 def get_version():
+    version = cache.get('version')
+    if version:
+        return tuple(version)
+
+    version = _get_version()
+    cache.update(version=version)
+
+    return version
+
+
+def _get_version():
     options = get_options()
 
     try:
@@ -46,12 +58,21 @@ def get_options():
         return options
 
     dll_path = dirname(get_dll()._name)
+
+    options = cache.get('options')
+    if options:
+        return options
+
     config_path = join(dll_path, 'configure.xml')
 
     if exists(config_path):
-        return get_options_hack(config_path)
+        options = get_options_hack(config_path)
     else:
-        return impl.get_options()
+        options = impl.get_options()
+
+    cache.update(options=options)
+
+    return options
 
 
 @memoized
@@ -77,7 +98,124 @@ def get_depth():
 
 @memoized
 def get_formats():
-    return impl.get_formats()
+    formats = cache.get('formats')
+    if formats:
+        return formats
+
+    formats = impl.get_formats()
+    cache.update(formats=formats)
+
+    return formats
+
+
+resources = enum('resource')
+
+
+def get_resources():
+    """Return usage and limits of ImageMagick resources.
+
+       :rtype: ``dict``
+
+       Maps names of :attr:`resources` known to loaded version like
+       ``'memory'``, ``'map'``, ``'disk'`` or ``'area'`` to tuples of current
+       usage and limit as reported by ImageMagick. Sizes are in bytes
+       except area which is in pixels.
+    """
+    return impl.get_resources()
+
+
+def get_limits():
+    """Return limits of ImageMagick resources.
+
+       :rtype: ``dict``
+
+       Maps names of :attr:`resources` to their limits, same as limits
+       in :func:`get_resources`.
+    """
+    return dict((name, limit)
+                for name, (_, limit) in impl.get_resources().items())
+
+
+def get_limit(name):
+    """Return limit of single ImageMagick resource.
+
+       :param name: name of one of :attr:`resources` or ``threads``
+       :type name: ``str``
+       :rtype: ``int``
+    """
+    return impl.get_limit(_alias(name))
+
+
+def set_limits(**limits):
+    """Set limits of ImageMagick resources.
+
+       Accepts names of :attr:`resources` as keywords e.g. ``memory``,
+       ``map``, ``disk`` and ``area`` for pixel cache placement or ``width``
+       and ``height`` on ImageMagick 6.8.9 and newer. ``threads`` is an alias
+       of ``thread`` limiting number of OpenMP threads used by a single
+       operation. Limits set to ``None`` are left intact.
+
+       Limits are process wide. ImageMagick silently lowers limits over
+       values configured in its policy, read them back with
+       :func:`get_limits` to see ones in effect. Unknown resources raise
+       :class:`pystacia.util.PystaciaException`.
+
+       >>> set_limits(threads=1, memory=256 * 2 ** 20)
+    """
+    for name, limit in _normalize(limits):
+        impl.set_limit(name, limit)
+
+
+def _normalize(limits):
+    """Return resource names and limits to set skipping ``None``."""
+    return [(_alias(name), limit)
+            for name, limit in limits.items() if limit is not None]
+
+
+def _alias(name):
+    return name == 'threads' and 'thread' or name
+
+
+class limits(object):
+
+    """Context guard setting resource limits for the duration of a block.
+
+       Accepts the same keywords as :func:`set_limits`. Previous limits are
+       restored on exit. As limits are process wide overlapping guards in
+       several threads restore limits in order they exit.
+
+       >>> with limits(threads=1):
+       ...     image.gaussian_blur(3)
+    """
+
+    def __init__(self, **kw):
+        self.__kw = kw
+        self.__state = []
+
+    def push(self):
+        """Set limits remembering previous ones"""
+        old = get_limits()
+
+        try:
+            for name, limit in _normalize(self.__kw):
+                impl.set_limit(name, limit)
+                self.__state.append((name, old[name]))
+        except:
+            # __exit__ is not called when entering fails
+            self.pop()
+            raise
+
+        return self
+
+    def pop(self):
+        """Restore previous limits"""
+        while self.__state:
+            impl.set_limit(*self.__state.pop())
+
+    __enter__ = push
+
+    def __exit__(self, type, value, traceback):  # @ReservedAssignment
+        self.pop()
 
 
 @memoized
@@ -86,6 +224,6 @@ def info():
             'formats': get_formats(),
             'dll': get_dll()._name}
 
-from pystacia.api import get_dll
+from pystacia.api import get_dll, cache
 from pystacia.api.func import c_call
 from pystacia.magick import _impl as impl
@@ -24,6 +24,36 @@ def get_formats():
 
     return [native_str(formats[i]).lower() for i in range(size.value)]
 
-from pystacia.compat import native_str
+
+def get_resources():
+    resources = {}
+
+    for name, value in resolve('resource')[0].items():
+        if name == 'undefined':
+            continue
+
+        resources[name] = (c_call('magick_', 'get_resource', value),
+                           c_call('magick_', 'get_resource_limit', value))
+
+    return resources
+
+
+def get_limit(name):
+    value = lookup(resources.cast(name))
+
+    return c_call('magick_', 'get_resource_limit', value)
+
+
+def set_limit(name, limit):
+    value = lookup(resources.cast(name))
+
+    if not c_call('magick_', 'set_resource_limit', value, limit):
+        template = formattable("Could not set limit of resource '{0}' to {1}")
+        raise PystaciaException(template.format(name, limit))
+
+from pystacia.util import PystaciaException
+from pystacia.compat import native_str, formattable
 from pystacia.api.func import c_call
+from pystacia.api.enum import resolve, lookup
 from pystacia.api.compat import c_size_t, byref
+from pystacia.magick import resources
@@ -0,0 +1,229 @@
+# coding: utf-8
+
+# pystacia/memory.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Accounting of pixel memory held by live images.
+
+   Once :func:`enable` is called footprint of every image is recomputed
+   after each call made on it so rescaling, cropping and replacing images
+   are reflected in totals. Footprints are estimates of pixel cache size
+   i.e. red, green, blue and opacity of quantum depth per pixel and black
+   channel on top of them for CMYK images.
+
+   >>> enable(sites=True)
+   >>> image = read('large.jpg')
+   >>> get_stats()['live']
+   100663296
+"""
+
+from __future__ import with_statement
+
+from threading import RLock
+
+from pystacia.api.trace import Hook
+
+
+def footprint(width, height, images=1, channels=4):
+    """Return bytes of pixel memory taken by images of given size.
+
+       ImageMagick 6 keeps 4 channels per pixel regardless of alpha, CMYK
+       images have 5.
+    """
+    return width * height * channels * (get_depth() or 16) // 8 * images
+
+
+class _Accountant(Hook):
+    def stop(self, call):
+        if isinstance(call.obj, Image):
+            update(call.obj)
+
+
+def enable(sites=False):
+    """Start accounting pixel memory of images.
+
+       :param sites: record source locations images were first accounted at
+       :type sites: ``bool``
+
+       Images already alive are accounted immediately unless they were
+       created with tracking disabled in which case they are accounted on
+       next operation.
+    """
+    global __accountant, __sites
+
+    with __lock:
+        __sites = sites
+
+        if __accountant:
+            return
+
+        __accountant = _Accountant()
+        add_hook(__accountant)
+
+    for resource in _registry.values():
+        if isinstance(resource, Image):
+            update(resource)
+
+
+def disable():
+    """Stop accounting and forget accounted images."""
+    global __accountant
+
+    with __lock:
+        if __accountant:
+            remove_hook(__accountant)
+
+        __accountant = None
+        __images.clear()
+        __site_totals.clear()
+        __totals['live'] = __totals['peak'] = 0
+
+
+def is_enabled():
+    """Check if pixel memory is being accounted."""
+    return __accountant is not None
+
+
+def update(image):
+    """Recompute footprint of image."""
+    if not __accountant:
+        return
+
+    if image.closed or not image.allocated:
+        size = 0
+    else:
+        count = get_stub('magick', 'get_number_images')(image)
+        size = 0
+        if count:
+            size = footprint(get_stub('image', ('get', 'width'))(image),
+                             get_stub('image', ('get', 'height'))(image),
+                             count, _get_channels(image))
+
+    key = id(image)
+
+    with __lock:
+        try:
+            old, site = __images[key]
+        except KeyError:
+            if not size:
+                return
+
+            old, site = 0, _get_site() if __sites else None
+
+        if size:
+            __images[key] = size, site
+        else:
+            del __images[key]
+
+        _add(size - old, site, (1 if not old else 0) - (1 if not size else 0))
+
+
+def _get_channels(image):
+    """Return number of channels kept in pixel cache of image."""
+    colorspace = get_stub('image', ('get', 'colorspace'))(image)
+
+    # black is kept in index channel next to pixel packets
+    return 5 if colorspace == enum_lookup(colorspaces.cmyk) else 4
+
+
+def release(image):
+    """Forget footprint of image being closed."""
+    if not __accountant:
+        return
+
+    with __lock:
+        try:
+            old, site = __images.pop(id(image))
+        except KeyError:
+            return
+
+        _add(-old, site, -1)
+
+
+def _add(delta, site, count):
+    live = __totals['live'] = __totals['live'] + delta
+    __totals['peak'] = max(__totals['peak'], live)
+
+    if site is None:
+        return
+
+    totals = __site_totals.setdefault(site, [0, 0])
+    totals[0] += count
+    totals[1] += delta
+
+    if not totals[0]:
+        del __site_totals[site]
+
+
+def _get_site():
+    frame = _getframe(1)
+
+    # first frame outside of pystacia is the caller
+    while frame and _is_internal(frame.f_globals.get('__name__', '')):
+        frame = frame.f_back
+
+    if not frame:
+        return None
+
+    return formattable('{0}:{1}').format(frame.f_code.co_filename,
+                                         frame.f_lineno)
+
+
+def _is_internal(name):
+    if name.startswith('pystacia.tests') or '.tests.' in name:
+        return False
+
+    return name == 'pystacia' or name.startswith('pystacia.')
+
+
+def reset_peak():
+    """Set high-water mark to current live total."""
+    with __lock:
+        __totals['peak'] = __totals['live']
+
+
+def get_stats(magick=True):
+    """Return accounted pixel memory.
+
+       :param magick: include ImageMagick's own resource counters
+       :type magick: ``bool``
+       :rtype: ``dict``
+
+       Returns bytes held by live images under ``'live'``, high-water mark
+       under ``'peak'``, number of accounted images under ``'images'`` and
+       when sites are recorded ``'sites'`` mapping source locations to
+       number of images and bytes. ImageMagick counters from
+       :func:`pystacia.magick.get_resources` are under ``'magick'``.
+    """
+    with __lock:
+        stats = {'live': __totals['live'], 'peak': __totals['peak'],
+                 'images': len(__images),
+                 'sites': dict((site, {'images': t[0], 'bytes': t[1]})
+                               for site, t in __site_totals.items())}
+
+    if magick:
+        stats['magick'] = get_resources()
+
+    return stats
+
+__accountant = None
+__sites = False
+__images = {}
+__site_totals = {}
+__totals = {'live': 0, 'peak': 0}
+__lock = RLock()
+
+
+from sys import _getframe
+
+from pystacia.compat import formattable
+from pystacia.common import _registry
+from pystacia.magick import get_depth, get_resources
+from pystacia.api.func import get_stub
+from pystacia.api.trace import add_hook, remove_hook
+from pystacia.api.enum import lookup as enum_lookup
+from pystacia.image import Image
+from pystacia.image.enum import colorspaces
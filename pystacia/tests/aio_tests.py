@@ -0,0 +1,98 @@
+# coding: utf-8
+
+# pystacia/tests/aio_tests.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+from sys import version_info
+
+from pystacia.tests.common import TestCase, skipIf
+
+
+@skipIf(version_info < (3, 7), 'asyncio API requires Python 3.7')
+class AioTest(TestCase):
+    def test_roundtrip(self):
+        img = sample()
+        blob = img.get_blob('png')
+        img.close()
+
+        img = run(aio.read_blob(blob))
+        run(aio.run(img, [('rescale', 32, 32), ('flip', axes.x)]))
+        result = run(aio.get_blob(img, 'png'))
+        img.close()
+
+        self.assertEqual(read_blob(result).size, (32, 32))
+
+    def test_run(self):
+        img = sample()
+        blob = img.get_blob('bmp')
+        img.close()
+
+        run_ = lambda *args: run(aio.run(*args))
+
+        img = run_(blob, [lambda i: i.rescale(10, 10)])
+        self.assertEqual(img.size, (10, 10))
+        img.close()
+
+        self.assertRaises(PystaciaException,
+                          lambda: run_(blob, [('rescale', -1, -1)]))
+
+    def test_cancel(self):
+        executor = aio.Executor(1, depth=1)
+        images = []
+
+        def slow():
+            sleep(0.2)
+            images.append(blank(10, 10))
+            return images[-1]
+
+        loop = new_event_loop()
+        task = loop.create_task(executor.submit(slow))
+        loop.run_until_complete(sleep_(0.05))
+        task.cancel()
+        loop.run_until_complete(wait([task]))
+        self.assertTrue(task.cancelled())
+
+        # slot is taken until the call actually finishes
+        loop.run_until_complete(executor.submit(lambda: None))
+        loop.close()
+
+        self.assertEqual(len(images), 1)
+        self.assertTrue(images[0].closed)
+        executor.shutdown()
+
+    def test_loops(self):
+        executor = aio.Executor(1, 1)
+        loops = []
+
+        async def contended():
+            loops.append(ref(get_running_loop()))
+            # waiting binds semaphore to the loop on newer pythons
+            await gather(executor.submit(sleep, .01),
+                         executor.submit(sleep, .01))
+
+        for _ in range(3):
+            run(contended())
+
+        collect()
+        # semaphores of closed loops are not kept around
+        self.assertEqual(len(executor._Executor__slots), 0)
+        self.assertEqual([loop() for loop in loops], [None] * 3)
+        executor.shutdown()
+
+
+from time import sleep
+from gc import collect
+from weakref import ref
+
+if version_info >= (3, 7):
+    from asyncio import (run, new_event_loop, get_running_loop, wait,
+                         gather, sleep as sleep_)
+
+    from pystacia import aio
+
+from pystacia.util import PystaciaException
+from pystacia.image import blank, read_blob, axes
+from pystacia.tests.common import sample
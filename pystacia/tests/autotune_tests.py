@@ -0,0 +1,151 @@
+# coding: utf-8
+
+# pystacia/tests/autotune_tests.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+from os import close, remove
+from tempfile import mkstemp
+
+from pystacia.tests.common import TestCase
+
+
+class AutotuneTest(TestCase):
+    def tearDown(self):
+        autotune.disable()
+
+    def test_get_threads(self):
+        model = {'ops': {'fx': [[100, 1], [10000, 2], [1000000, 8]]}}
+
+        self.assertEqual(autotune.get_threads(model, 'fx', 1, 1), 1)
+        self.assertEqual(autotune.get_threads(model, 'fx', 90, 90), 2)
+        self.assertEqual(autotune.get_threads(model, 'fx', 900, 900), 8)
+        self.assertEqual(autotune.get_threads(model, 'fx', 5000, 5000), 8)
+        self.assertEqual(autotune.get_threads(model, 'resize', 10, 10),
+                         None)
+
+        self.assertEqual(autotune.get_thread_counts(1), [1])
+        self.assertEqual(autotune.get_thread_counts(6), [1, 2, 4, 6])
+
+    def test_calibrate(self):
+        cases = autotune.get_cases()
+        self.assertEqual(sorted(cases),
+                         ['composite', 'fx', 'gaussian_blur', 'resize'])
+
+        model = autotune.calibrate([16, 32], [1, 2],
+                                   {'gaussian_blur': cases['gaussian_blur']},
+                                   1, 1)
+        entries = model['ops']['gaussian_blur']
+        self.assertEqual(len(entries), 2)
+        self.assertTrue(entries[0][0] < entries[1][0])
+        self.assertTrue(set(c for _, c in entries) <= set([1, 2]))
+
+        fd, path = mkstemp()
+        close(fd)
+        autotune.save(model, path)
+        self.assertEqual(autotune.load(path), model)
+        remove(path)
+
+        self.assertEqual(autotune.load(path), None)
+
+    def test_overlapping(self):
+        default = get_limits()['thread']
+        model = {'format': 1, 'ops': {'gaussian_blur': [[100, 2],
+                                                         [10000, 1]]}}
+        arrived = []
+        condition = Condition()
+
+        class Barrier(Hook):
+            def start(self, call):
+                if call.method != 'gaussian_blur':
+                    return
+
+                # keep both calls in flight until each of them started
+                with condition:
+                    arrived.append(call)
+                    condition.notify_all()
+                    while len(arrived) < 2:
+                        condition.wait()
+
+        images = [blank(10, 10), blank(100, 100)]
+        barrier = Barrier()
+
+        autotune.enable(model)
+        add_hook(barrier)
+        try:
+            threads = [Thread(target=image.gaussian_blur, args=(1,))
+                       for image in images]
+            [t.start() for t in threads]
+            [t.join() for t in threads]
+        finally:
+            remove_hook(barrier)
+
+        self.assertEqual(len(arrived), 2)
+        self.assertEqual(get_limits()['thread'], default)
+
+        for image in images:
+            image.close()
+
+    def test_no_cache(self):
+        registry.no_cache = True
+        try:
+            self.assertEqual(autotune.load(), None)
+        finally:
+            del registry.no_cache
+
+    def test_enable(self):
+        default = get_limits()['thread']
+        model = {'format': 1, 'ops': {'gaussian_blur': [[1, 1]]}}
+
+        seen = []
+
+        class Probe(Hook):
+            def start(self, call):
+                seen.append((call.method, get_limits()['thread']))
+
+        probe = Probe()
+
+        autotune.enable(model)
+        self.assertTrue(autotune.is_enabled())
+        add_hook(probe)
+        try:
+            img = blank(10, 10)
+            img.gaussian_blur(1)
+            img.close()
+        finally:
+            remove_hook(probe)
+
+        self.assertTrue(('gaussian_blur', 1) in seen)
+        self.assertEqual(get_limits()['thread'], default)
+
+        autotune.disable()
+        self.assertFalse(autotune.is_enabled())
+        self.assertEqual(get_limits()['thread'], default)
+
+    def test_limit(self):
+        default = get_limits()['thread']
+        model = {'format': 1, 'ops': {'gaussian_blur': [[1, 4]],
+                                      'fx': [[1, 1]]}}
+
+        autotune.enable(model)
+
+        with limits(threads=2):
+            img = blank(10, 10)
+            img.gaussian_blur(1)
+            self.assertEqual(get_limits()['thread'], 2)
+
+            img.fx('u')
+            self.assertEqual(get_limits()['thread'], 2)
+            img.close()
+
+        self.assertEqual(get_limits()['thread'], default)
+
+
+from threading import Thread, Condition
+
+from pystacia import autotune, registry
+from pystacia.magick import get_limits, limits
+from pystacia.image import blank
+from pystacia.api.trace import Hook, add_hook, remove_hook
@@ -0,0 +1,172 @@
+# coding: utf-8
+
+# pystacia/tests/batch_tests.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+from __future__ import with_statement
+
+from six import PY3
+
+from pystacia.tests.common import TestCase, skipIf
+
+
+class BatchTest(TestCase):
+    def test_map(self):
+        img = sample()
+        blob = img.get_blob('bmp')
+        img.close()
+
+        def pipeline(image):
+            if image.width > 100:
+                raise PystaciaException('Too big')
+
+            return image.rescale(10, 10).get_blob('png')
+
+        inputs = [blob, blank(20, 20).get_blob('png'), b('garbage')] * 5
+        results = list(batch.map(pipeline, inputs, threads=4))
+
+        self.assertEqual([r.index for r in results], list(range(15)))
+
+        for result in results:
+            self.assertEqual(result.input, inputs[result.index])
+            self.assertEqual(result.ok, result.index % 3 == 1)
+
+            if result.ok:
+                self.assertEqual(read_blob(result.get()).size, (10, 10))
+            else:
+                self.assertRaises(PystaciaException, result.get)
+
+        results = batch.map(pipeline, inputs, threads=4, ordered=False)
+        self.assertEqual(sorted(r.index for r in results), list(range(15)))
+
+    def test_memory(self):
+        img = blank(64, 64)
+        inputs = [img.get_blob('bmp')] * 8
+        cost = batch.estimate(img)
+        self.assertEqual(batch.estimate(inputs[0]), cost)
+        peaks = []
+
+        def pipeline(image):
+            peaks.append(budget_used())
+            return image.size
+
+        budget = batch.budget
+
+        class tracking(budget):
+            def __init__(self, limit):
+                budget.__init__(self, limit)
+                used.append(self)
+
+        used = []
+        budget_used = lambda: used[0].used
+        batch.budget = tracking
+        try:
+            results = list(batch.map(pipeline, inputs, threads=4,
+                                     memory=cost * 2))
+        finally:
+            batch.budget = budget
+
+        self.assertEqual([r.get() for r in results], [(64, 64)] * 8)
+        self.assertTrue(max(peaks) <= cost * 2)
+        self.assertEqual(used[0].used, 0)
+
+    def test_process(self):
+        img = blank(10, 10)
+
+        self.assertEqual(batch.process(lambda i: i.size, img), (10, 10))
+        self.assertFalse(img.closed)
+
+        self.assertEqual(batch.process(lambda i: i, img), img)
+        self.assertFalse(img.closed)
+
+        blob = img.get_blob('bmp')
+        loaded = []
+
+        def pipeline(image):
+            loaded.append(image)
+            return image
+
+        result = batch.process(pipeline, blob)
+        self.assertFalse(result.closed)
+
+        loaded = []
+        batch.process(lambda i: loaded.append(i), blob)
+        self.assertTrue(loaded[0].closed)
+
+    def test_early_exit(self):
+        inputs = (blank(5, 5) for _ in range(100))
+
+        for result in batch.map(lambda i: i.size, inputs, threads=2):
+            break
+
+        self.assertEqual(result.get(), (5, 5))
+
+    def test_process_pool(self):
+        img = sample()
+        inputs = [img, img.get_blob('png'), b('garbage')]
+
+        with batch.ProcessPool(2, formats=['png']) as pool:
+            results = list(pool.map(halve, inputs))
+
+        self.assertEqual([r.index for r in results], [0, 1, 2])
+        self.assertEqual(results[0].input, img)
+
+        for result in results[:2]:
+            image = read_blob(result.get())
+            self.assertEqual(image.size, (img.width // 2, img.height // 2))
+            image.close()
+
+        self.assertFalse(results[2].ok)
+        self.assertRaises(PystaciaException, results[2].get)
+
+        inputs = (b('garbage') for _ in range(10))
+        with batch.ProcessPool(2) as pool:
+            results = list(pool.map(unpicklable, [img] + list(inputs),
+                                    ordered=False, chunksize=2, window=1))
+
+        self.assertEqual(sorted(r.index for r in results), list(range(11)))
+        self.assertFalse([r for r in results if r.ok])
+
+        img.close()
+
+    @skipIf(not PY3, 'Pool reports failed tasks on Python 3 only')
+    def test_process_pool_broken(self):
+        inputs = [b('garbage')] * 5
+        with batch.ProcessPool(2) as pool:
+            results = list(pool.map(Broken(), inputs, chunksize=2))
+
+        self.assertEqual([r.index for r in results], list(range(5)))
+        self.assertFalse([r for r in results if r.ok])
+
+
+def halve(image):
+    return image.rescale(factor=.5)
+
+
+def unpicklable(image):
+    return Lock()
+
+
+def broken():
+    raise PystaciaException('Pipeline can not be unpickled')
+
+
+class Broken(object):
+    def __call__(self, image):
+        return image
+
+    def __reduce__(self):
+        return broken, ()
+
+
+from threading import Lock
+
+from six import b
+
+from pystacia import batch
+from pystacia.util import PystaciaException
+from pystacia.image import blank, read_blob
+from pystacia.tests.common import sample
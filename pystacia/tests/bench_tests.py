@@ -0,0 +1,53 @@
+# coding: utf-8
+
+# pystacia/tests/bench_tests.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+from os import close, remove
+from tempfile import mkstemp
+
+from pystacia.tests.common import TestCase
+
+
+class BenchTest(TestCase):
+    def test_run(self):
+        cases = [c for c in bench.get_cases(['png'])
+                 if c.name in ('rescale', 'overlay', 'read_blob:png',
+                               'get_pixel')]
+        cases.append(bench.op('non_existant'))
+        self.assertEqual(len(cases), 5)
+
+        results = bench.run(cases, ['rose'], [32, None], [1, 2], 1, 1)
+        results = results['results']
+
+        self.assertEqual(len(results), 20)
+        self.assertTrue(results['rescale/rose@32/x1']['best'] > 0)
+        self.assertTrue(results['read_blob:png/rose@orig/x2']['best'] > 0)
+        self.assertTrue('error' in results['non_existant/rose@32/x1'])
+
+    def test_compare(self):
+        img = rose()
+        results = {'meta': bench.get_meta(),
+                   'results': {'a': bench.measure(bench.op('flip', axes.x),
+                                                  img, 1, 1, 1),
+                               'b': {'error': 'failed'}}}
+        img.close()
+
+        fd, path = mkstemp()
+        close(fd)
+        bench.save(results, path)
+        baseline = bench.load(path)
+        remove(path)
+
+        self.assertEqual(bench.compare(results, baseline), [])
+
+        baseline['results']['a']['best'] /= 2
+        self.assertEqual([key for key, _, _ in
+                          bench.compare(results, baseline, .5)], ['a'])
+
+
+from pystacia import bench
+from pystacia.image import rose, axes
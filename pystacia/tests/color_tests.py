@@ -6,6 +6,8 @@
 # This module is part of Pystacia and is released under
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 
+from __future__ import division
+
 from re import match
 from threading import Thread
 
@@ -154,11 +156,101 @@ class ColorTest(TestCase):
         [t.start() for t in threads]
         [t.join() for t in threads]
 
+    def test_lazy(self):
+        count = len(common._registry)
+
+        red = color.from_rgb(1, 0, 0)
+        self.assertFalse(red.allocated)
+        self.assertEqual(red.get_rgba(), (1, 0, 0, 1))
+        red.alpha = 0.5
+        self.assertEqual(len(common._registry), count)
+
+        copy = red.copy()
+        self.assertFalse(copy.allocated)
+
+        img = blank(1, 1, red)
+        self.assertTrue(red.allocated)
+        self.assertEqual(len(common._registry), count + 2)
+        self.assertEqual(img.get_pixel(0, 0).get_rgba(), (1, 0, 0, 0.5))
+        img.close()
+
+        red.close()
+        self.assertTrue(red.closed)
+        self.assertRaisesRegexp(PystaciaException, 'closed',
+                                lambda: red.get_rgba())
+
+        copy.close()
+        self.assertTrue(copy.closed)
+        self.assertEqual(len(common._registry), count)
+
+    def test_precision(self):
+        value = 0.12345678
+        tone = color.from_rgba(value, 0, 0, 1)
+        tone.green = 1 / 3
+        self.assertEqual(tone.get_rgba(), (0.1235, 0.3333, 0, 1))
+
+        # exact components reach PixelWand, not the rounded ones
+        step = 1 / (2 ** (get_depth() or 16) - 1)
+        self.assertTrue(abs(c_call('pixel', 'get_red', tone) - value) <= step)
+        self.assertTrue(abs(c_call('pixel', 'get_green', tone) - 1 / 3) <=
+                        step)
+        tone.close()
+
+    def test_freeze(self):
+        red = color.from_string('red')
+        self.assertRaises(TypeError, lambda: hash(red))
+
+        self.assertIs(red.freeze(), red)
+        self.assertTrue(red.frozen)
+        self.assertEqual(hash(red), hash(color.from_rgb(1, 0, 0).freeze()))
+        self.assertEqual(len(set([red, color.from_rgb(1, 0, 0).freeze()])),
+                         1)
+
+        def set_red():
+            red.red = 0
+
+        self.assertRaisesRegexp(PystaciaException, 'Frozen', set_red)
+        self.assertRaisesRegexp(PystaciaException, 'Frozen',
+                                lambda: red.set_string('blue'))
+
+        copy = red.copy()
+        self.assertFalse(copy.frozen)
+        copy.red = 0
+        self.assertEqual(copy, 'black')
+
+    def test_intern(self):
+        red = color.cast('red')
+        self.assertIsNot(color.cast(' RED'), red)
+        self.assertFalse(red.frozen)
+        self.assertFalse(red.allocated)
+        self.assertEqual(color.cast(' RED'), red)
+
+        # casts are owned by caller
+        red.red = 0
+        red.close()
+        self.assertEqual(color.cast('red'), (1, 0, 0))
+
+        img = blank(2, 2)
+        img.rotate(45)
+        self.assertEqual(img.get_pixel(0, 0), 'transparent')
+        img.close()
+
+        # specifications beyond RGBA go straight to PixelWand
+        cmyk = color.from_string('cmyk(0%, 0%, 0%, 50%)')
+        self.assertTrue(cmyk.allocated)
+        cmyk.freeze()
+        self.assertRaisesRegexp(PystaciaException, 'Frozen',
+                                lambda: cmyk.set_string('cmyk(0,0,0,0)'))
+        cmyk.close()
+
     def test_bad_string(self):
         self.assertRaisesRegexp(PystaciaException, 'Unknown color',
                                 lambda: color.from_string('x-wrong-color'))
 
 from pystacia.color._impl import saturate
-from pystacia import color, registry
+from pystacia.magick import get_depth
+from pystacia.api.func import c_call
+from pystacia import color, registry, common
+from pystacia.image import blank
 from pystacia.util import PystaciaException
 from pystacia.compat import formattable
@@ -100,6 +100,44 @@ class ResourceTest(TestCase):
 
         self.assertEqual(len(common._registry), count)
 
+    def test_untracked(self):
+        count = self.count
+
+        with untracked():
+            mock1 = Mock()
+
+            with untracked():
+                mock2 = Mock()
+
+            mock3 = Mock()
+
+        mock4 = Mock()
+
+        self.assertEqual(len(common._registry), count + 1)
+        self.assertEqual(common._registry.values().count(mock4), 1)
+
+        for mock in mock1, mock2, mock3, mock4:
+            mock.close()
+
+        self.assertEqual(len(common._registry), count)
+
+    def test_threaded(self):
+        count = self.count
+
+        def thread():
+            for _ in range(randint(0, 100)):
+                mock = Mock()
+                if randint(0, 1):
+                    mock.close()
+                else:
+                    mock._claim()
+
+        threads = [Thread(target=thread) for _ in range(randint(0, 50))]
+        [t.start() for t in threads]
+        [t.join() for t in threads]
+
+        self.assertEqual(len(common._registry), count)
+
     def test_called(self):
         count = self.count
 
@@ -192,7 +230,10 @@ class ResourceTest(TestCase):
         self.assertRaisesRegexp(PystaciaException, '_clone',
                                 lambda: mock.copy())
 
-from pystacia.common import Resource
+from random import randint
+from threading import Thread
+
+from pystacia.common import Resource, untracked
 
 
 class Mock(Resource):
@@ -23,6 +23,37 @@ class MagickTest(TestCase):
         formats = get_formats()
         self.assertIn('bmp', formats)
 
+    def test_resources(self):
+        resources = get_resources()
 
+        for name in 'memory', 'map', 'disk', 'area':
+            usage, limit = resources[name]
+            self.assertTrue(0 <= usage <= limit)
+
+    def test_limits(self):
+        old = get_limits()
+
+        with limits(threads=1, area=old['area'] // 2, memory=None) as guard:
+            self.assertTrue(isinstance(guard, limits))
+            new = get_limits()
+            self.assertEqual(new['thread'], 1)
+            self.assertEqual(new['area'], old['area'] // 2)
+            self.assertEqual(new['memory'], old['memory'])
+
+        self.assertEqual(get_limits(), old)
+
+        self.assertRaises(PystaciaException,
+                          lambda: set_limits(nonexistent=1))
+
+        try:
+            set_limits(threads=1)
+            self.assertEqual(get_limits()['thread'], 1)
+            self.assertEqual(get_limit('threads'), 1)
+        finally:
+            set_limits(thread=old['thread'])
+
+
+from pystacia.util import PystaciaException
 from pystacia.magick import (
-    get_options, get_version, get_version_str, get_formats)
+    get_options, get_version, get_version_str, get_formats, get_resources,
+    get_limit, get_limits, set_limits, limits)
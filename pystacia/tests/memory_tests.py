@@ -0,0 +1,75 @@
+# coding: utf-8
+
+# pystacia/tests/memory_tests.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+from os.path import splitext
+
+from pystacia.tests.common import TestCase
+
+
+class MemoryTest(TestCase):
+    def tearDown(self):
+        memory.disable()
+
+    def test_accounting(self):
+        existing = blank(10, 10)
+
+        memory.enable(sites=True)
+        self.assertTrue(memory.is_enabled())
+
+        stats = memory.get_stats()
+        self.assertEqual(stats['live'], memory.footprint(10, 10))
+        self.assertTrue('memory' in stats['magick'])
+
+        img = blank(100, 100)
+        live = memory.footprint(10, 10) + memory.footprint(100, 100)
+        self.assertEqual(memory.get_stats(False)['live'], live)
+
+        img.rescale(50, 50)
+        live -= memory.footprint(100, 100) - memory.footprint(50, 50)
+        stats = memory.get_stats(False)
+        self.assertEqual(stats['live'], live)
+        self.assertEqual(stats['peak'],
+                         memory.footprint(10, 10) +
+                         memory.footprint(100, 100))
+
+        copy = img.copy()
+        self.assertEqual(memory.get_stats(False)['images'], 3)
+
+        sites = memory.get_stats(False)['sites']
+        self.assertEqual(sum(s['images'] for s in sites.values()), 3)
+        self.assertTrue([s for s in sites
+                         if s.startswith(splitext(__file__)[0])])
+
+        for image in img, copy, existing:
+            image.close()
+
+        stats = memory.get_stats(False)
+        self.assertEqual((stats['live'], stats['images']), (0, 0))
+
+        memory.reset_peak()
+        self.assertEqual(memory.get_stats(False)['peak'], 0)
+
+    def test_cmyk(self):
+        memory.enable()
+
+        img = blank(10, 10)
+        img.convert_colorspace('cmyk')
+        self.assertEqual(memory.get_stats(False)['live'],
+                         memory.footprint(10, 10, channels=5))
+
+        img.close()
+
+    def test_disabled(self):
+        img = blank(10, 10)
+        self.assertFalse(memory.is_enabled())
+        self.assertEqual(memory.get_stats(False)['live'], 0)
+        img.close()
+
+
+from pystacia import memory
+from pystacia.image import blank
@@ -144,11 +144,42 @@ class MemoizedTest(TestCase):
         [t.start() for t in threads]
         [t.join() for t in threads]
 
+    def test_bounded(self):
+        square.cache_clear()
+        del calls[:]
+
+        for x in (1, 2, 3, 1, 4, 1, 5, 1):
+            self.assertEqual(square(x), x * x)
+
+        # frequently used value survives eviction
+        self.assertEqual(calls, [1, 2, 3, 4, 5])
+        self.assertEqual(square.cache_info(),
+                         {'hits': 3, 'misses': 5, 'maxsize': 3, 'size': 3})
+
+        square.cache_clear()
+        self.assertEqual(square.cache_info()['size'], 0)
+
+        info = cache_info()
+        self.assertIn('pystacia.tests.util_tests.square', info)
+        self.assertIsNone(info['pystacia.tests.util_tests.add']['maxsize'])
+
+    def test_bounded_threaded(self):
+        def thread():
+            for _ in range(randint(0, 50)):
+                x = randint(0, 10)
+                self.assertEqual(square(x), x * x)
+
+        threads = [Thread(target=thread) for _ in range(randint(0, 50))]
+        [t.start() for t in threads]
+        [t.join() for t in threads]
+
+        self.assertLessEqual(square.cache_info()['size'], 3)
+
 
 class A(object):
     pass
 
-from pystacia.util import memoized
+from pystacia.util import memoized, cache_info
 
 
 @memoized
@@ -157,6 +188,15 @@ def producer(arg=None):
     return A()
 
 
+calls = []
+
+
+@memoized(maxsize=3)
+def square(x):
+    calls.append(x)
+    return x * x
+
+
 @memoized
 def add(a, b):
     return a + b
@@ -11,6 +11,7 @@ from __future__ import with_statement
 from sys import version_info
 import platform
 from threading import Lock, RLock
+from collections import deque
 
 from decorator import decorator
 
@@ -86,41 +87,141 @@ def chainable(f, obj, *args, **kw):
     return obj
 
 
-# memoized cache
-__cache = {}
+class _Cache(object):
 
+    """Cache of results of a single memoized function.
 
-@decorator
-def memoized(f, *args, **kw):
+       Hits are served without taking any locks. Misses lock only the key
+       being computed so different keys are computed concurrently and each
+       key is computed once. Bounded caches evict with CLOCK algorithm,
+       an approximation of :term:`LRU` which doesn't need to reorder
+       anything on hits.
+    """
+
+    def __init__(self, f, maxsize=None):
+        self.f = f
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self.__data = {}
+        self.__locks = {}
+        self.__clock = deque()
+        self.__lock = RLock()
+
+    def get(self, args, kw):
+        key = (args, frozenset(kw.items())) if kw else args
+
+        try:
+            entry = self.__data[key]
+        except KeyError:
+            pass
+        else:
+            # second chance for recently used entries
+            entry[1] = True
+            self.hits += 1
+
+            return entry[0]
+
+        with self.__lock:
+            lock = self.__locks.setdefault(key, RLock())
+
+        with lock:
+            entry = self.__data.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry[0]
+
+            self.misses += 1
+
+            info = self.f.__name__, args
+            logger.debug(formattable('Memoizing {0} args={1}').format(*info))
+
+            try:
+                result = self.f(*args, **kw)
+                self.__store(key, result)
+            finally:
+                with self.__lock:
+                    self.__locks.pop(key, None)
+
+            logger.debug(formattable('Memoized {0} args={1}').format(*info))
+
+        return result
+
+    def __store(self, key, value):
+        with self.__lock:
+            if self.maxsize is not None:
+                self.__evict(self.maxsize - 1)
+                self.__clock.append(key)
+
+            self.__data[key] = [value, False]
+
+    def __evict(self, size):
+        data, clock = self.__data, self.__clock
+
+        while len(data) > size and clock:
+            key = clock.popleft()
+            entry = data.get(key)
+
+            if entry is None:
+                continue
+            elif entry[1]:
+                entry[1] = False
+                clock.append(key)
+            else:
+                del data[key]
+
+    def info(self):
+        """Return dictionary with hits, misses, maxsize and current size."""
+        return {'hits': self.hits, 'misses': self.misses,
+                'maxsize': self.maxsize, 'size': len(self.__data)}
+
+    def clear(self):
+        """Remove all cached results and reset statistics."""
+        with self.__lock:
+            self.__data.clear()
+            self.__clock.clear()
+            self.hits = self.misses = 0
+
+
+def memoized(f=None, maxsize=None):
     """Decorator that caches a function's return value each time it is called.
 
     If called later with the same arguments, the cached value is returned, and
     not re-evaluated. This decorator performs proper synchronization to make it
-    thread-safe.
+    thread-safe. Can be used as ``@memoized`` keeping results forever or as
+    ``@memoized(maxsize=n)`` evicting least recently used results once there
+    is more than n of them. Decorated function gets ``cache_info`` and
+    ``cache_clear`` attributes.
     """
-    key = f, args, frozenset(kw.items())
-    if key not in __cache:
-        with __lock:
-            if key not in __cache:
-                __cache[key] = {'lock': RLock()}
+    if f is None:
+        return lambda f: memoized(f, maxsize)
+
+    cache = _Cache(f, maxsize)
+
+    def call(f, *args, **kw):
+        return cache.get(args, kw)
+
+    decorated = decorator(call, f)
+    decorated.cache_info = cache.info
+    decorated.cache_clear = cache.clear
+
+    with __lock:
+        __caches.append(cache)
+
+    return decorated
 
-    key_cache = __cache[key]
-    if 'value' not in key_cache:
-        with key_cache['lock']:
-            if 'value' not in key_cache:
-                info = key[0].__name__, key[1]
-                msg = formattable('Memoizing {0} args={1}').format(*info)
-                logger.debug(msg)
 
-                result = f(*args, **kw)
+def cache_info():
+    """Return statistics of all memoized functions keyed by their names."""
+    with __lock:
+        caches = list(__caches)
 
-                key_cache['value'] = result
-                msg = formattable('Memoized {0} args={1}').format(*info)
-                logger.debug(msg)
+    return dict((cache.f.__module__ + '.' + cache.f.__name__, cache.info())
+                for cache in caches)
 
-    return key_cache['value']
 
-__lock = Lock()
+__caches = []
+# reentrant as __del__ of resources can run from within critical section
+__lock = RLock()
 
 
 @memoized
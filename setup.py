@@ -199,6 +199,7 @@ except NameError:
 packages = ['pystacia',
             'pystacia.api',
             'pystacia.api.tests',
+            'pystacia.bench',
             'pystacia.color',
             'pystacia.image',
             'pystacia.image._impl',
@@ -226,6 +227,8 @@ dev_require = test_require + docs_require + ['ipython']
 
 lint_require = ['pylama', 'pylint', 'py3kwarn', 'clonedigger', 'html2rest']
 
+cffi_require = ['cffi']
+
 setup(
     name='pystacia',
     description='Python raster imaging library',
@@ -243,7 +246,8 @@ setup(
         'lint': lint_require,
         'docs': docs_require,
         'dev': dev_require,
-        'lint': lint_require
+        'lint': lint_require,
+        'cffi': cffi_require
     },
     cmdclass=cmdclass,
     classifiers=[